@@ -1,8 +1,17 @@
-"""Eyesight - Gemini Live API interaction with audio/video."""
+"""Eyesight - Gemini Live API interaction with audio/video.
 
-from eyesight.core.app import EyesightApp
-from eyesight.config import VideoMode, AUDIO_CONFIG, GEMINI_CONFIG
-from eyesight.ui import run_gui
+The public names below are imported on first access, so importing the
+package, or the CLI to parse its arguments, does not load the Gemini SDK,
+PortAudio, OpenCV or Tk.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from eyesight.core.app import EyesightApp
+    from eyesight.config import VideoMode, AUDIO_CONFIG, GEMINI_CONFIG
+    from eyesight.ui import run_gui
 
 __version__ = "0.1.0"
 __all__ = [
@@ -12,3 +21,23 @@ __all__ = [
     "GEMINI_CONFIG",
     "run_gui",
 ]
+
+_LAZY = {
+    "EyesightApp": "eyesight.core.app",
+    "VideoMode": "eyesight.config",
+    "AUDIO_CONFIG": "eyesight.config",
+    "GEMINI_CONFIG": "eyesight.config",
+    "run_gui": "eyesight.ui",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
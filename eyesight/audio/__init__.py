@@ -3,5 +3,7 @@ The `eyesight.audio` module provides functionality for capturing and playing aud
 within the Eyesight application.
 
 It centralizes audio device management and stream operations through the
-`AudioManager` class, used by the `capture` and `playback` submodules.
+`AudioManager` class, used by the `capture` and `playback` submodules, on top
+of the process-wide PyAudio instance held by `engine.AudioEngine`. PCM
+chunks are staged in preallocated `AudioRing` buffers from the `ring` submodule.
 """
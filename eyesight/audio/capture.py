@@ -1,27 +1,109 @@
 """Audio capture functionality for the Eyesight application."""
 
 import asyncio
+import contextlib
+import logging
+from typing import Optional
 
+import pyaudio
 
+from eyesight.audio.config import VAD_LOCAL_BARGE_IN
+from eyesight.audio.latency import LatencyTracker
 from eyesight.audio.manager import AudioManager, _run_audio_task
+from eyesight.audio.playback import LOCAL, JitterBuffer
+from eyesight.audio.ring import AudioRing
+from eyesight.audio.vad import SPEECH_END, VoiceGate
+from eyesight.config import AUDIO_CONFIG
 
+logger = logging.getLogger(__name__)
 
-async def capture_audio(queue: asyncio.Queue):
+
+async def capture_audio(
+    queue: asyncio.Queue,
+    gate: Optional[VoiceGate] = None,
+    playback: Optional[JitterBuffer] = None,
+    audio_manager: Optional[AudioManager] = None,
+    latency: Optional[LatencyTracker] = None,
+    barge_in: bool = VAD_LOCAL_BARGE_IN,
+):
     """
     Captures audio from the microphone using the AudioManager and puts the
     audio data onto the provided queue.
 
+    With a voice gate, only speech (plus its pre-roll and hangover) is
+    queued, and `SPEECH_END` is queued when a stretch of speech ends. With
+    `barge_in`, speech starting while `playback` is playing interrupts it
+    at once instead of waiting for the server to notice.
+
+    A shared `audio_manager` is used as is, reusing its input stream if
+    already open; otherwise a manager is created for this task alone.
+    Ends of speech are reported to `latency` when given.
+
+    Each chunk is copied into a preallocated AudioRing and queued as an
+    AudioChunk descriptor; the consumer releases it once sent. Chunks are
+    dropped, and counted as ring overruns, if the consumer falls so far
+    behind that the ring fills up.
+
     This function runs indefinitely until cancelled.
     """
-    async with AudioManager() as audio_manager:
+    config = AUDIO_CONFIG
+    ring = AudioRing(
+        int(
+            config.capture_ring_seconds
+            * config.send_sample_rate
+            * config.channels
+            * pyaudio.get_sample_size(config.format)
+        )
+    )
+
+    if audio_manager is not None:
+        manager_context = contextlib.nullcontext(audio_manager)
+    else:
+        manager_context = AudioManager()
+
+    async with manager_context as audio_manager:
+
+        async def _open():
+            stream = audio_manager.input_stream
+            return stream or await audio_manager.open_input_stream()
 
         async def _capture_and_put():
             data = await audio_manager.capture_chunk()
-            await queue.put({"data": data, "mime_type": "audio/pcm"})
+            if gate is None:
+                pending = [data]
+            else:
+                was_speaking = gate.speaking
+                pending = gate.process(data)
+                if was_speaking and not gate.speaking:
+                    if latency is not None:
+                        latency.speech_ended(gate.last_voiced)
+                    await queue.put(SPEECH_END)
+                elif (
+                    barge_in
+                    and gate.speaking
+                    and not was_speaking
+                    and playback is not None
+                    and playback.active
+                ):
+                    playback.interrupt(LOCAL)
 
-        return await _run_audio_task(
-            audio_manager,
-            audio_manager.open_input_stream,
-            _capture_and_put,
-            "Audio capture task cancelled.",
-        )
+            for data in pending:
+                chunk = ring.write(data)
+                if chunk is not None:
+                    await queue.put(chunk)
+
+        try:
+            return await _run_audio_task(
+                audio_manager,
+                _open,
+                _capture_and_put,
+                "Audio capture task cancelled.",
+            )
+        finally:
+            logger.info(
+                "Audio capture: %d chunks, %d dropped on full ring",
+                ring.written,
+                ring.overruns,
+            )
+            if gate is not None:
+                gate.log_summary()
@@ -0,0 +1,69 @@
+"""Configuration settings for the Eyesight audio module."""
+
+import typing
+
+# Whether the microphone uplink is gated on voice activity
+VAD_ENABLED: bool = True
+
+# Level in dBFS below which a chunk is never treated as speech
+VAD_MIN_LEVEL_DB: float = -50.0
+
+# How far above the tracked noise floor, in dB, a chunk must be for speech
+VAD_MARGIN_DB: float = 12.0
+
+# Fraction of the gap to a louder level the noise floor rises per chunk
+VAD_FLOOR_RISE: float = 0.02
+
+# Slower rise of the noise floor while the gate is open, so a lasting step
+# up in background noise closes it again after several seconds instead of
+# holding it open, while a spoken sentence barely moves it
+VAD_SPEECH_FLOOR_RISE: float = 0.005
+
+# Audio kept forwarding after the last voiced chunk
+VAD_HANGOVER_SECONDS: float = 0.5
+
+# Audio held back during silence and sent ahead of a speech onset
+VAD_PREROLL_SECONDS: float = 0.3
+
+# Forward one chunk this often during silence, or None to send nothing
+VAD_KEEPALIVE_SECONDS: typing.Optional[float] = None
+
+# Whether a speech onset during playback cuts the reply off locally,
+# before the server notices. Off by default: through speakers the reply
+# itself reaches the microphone and would interrupt it. Enable it with
+# headphones or echo cancellation.
+VAD_LOCAL_BARGE_IN: bool = False
+
+# Playout depth the jitter buffer waits for before starting a turn
+JITTER_TARGET_SECONDS: float = 0.08
+
+# Bounds for the adaptive playout depth
+JITTER_MIN_TARGET_SECONDS: float = 0.04
+JITTER_MAX_TARGET_SECONDS: float = 0.5
+
+# Multiple of the observed arrival jitter added to the base depth
+JITTER_DEPTH_FACTOR: float = 2.0
+
+# Received audio held by the jitter buffer before new chunks are dropped.
+# Replies arrive faster than real time, so this covers whole turns.
+JITTER_CAPACITY_SECONDS: float = 30.0
+
+# Filter taps per output sample, at the lower rate, used when resampling
+RESAMPLER_TAPS: int = 16
+
+# Time each voice turn from end of speech to first reply sample played
+LATENCY_TRACKING: bool = True
+
+# Number of recent turns covered by the rolling latency percentiles
+LATENCY_WINDOW_TURNS: int = 100
+
+# Log the rolling latency percentiles every this many turns, so they are
+# seen while running and survive a crash; 0 logs them only at shutdown
+LATENCY_LOG_EVERY_TURNS: int = 10
+
+# Longest time the first audio chunk of an uplink message waits for more
+# chunks to merge with; 0 sends every chunk on its own
+AUDIO_BATCH_WINDOW_SECONDS: float = 0.1
+
+# Most audio merged into a single uplink message
+AUDIO_BATCH_MAX_SECONDS: float = 0.5
@@ -0,0 +1,182 @@
+"""Process-wide PyAudio engine shared by every AudioManager."""
+
+import atexit
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import pyaudio
+
+logger = logging.getLogger(__name__)
+
+DeviceInfo = Dict[str, Any]
+
+
+class AudioEngine:
+    """Owns the single PyAudio instance of the process.
+
+    Initialising PortAudio and enumerating devices is slow, so it is done
+    once, on first use or ahead of time through `warm_up`, and the default
+    device info is cached. Managers borrow the instance and never
+    terminate it, so it survives across sessions; it is terminated when
+    the process exits.
+
+    PortAudio is not thread-safe, and PyAudio releases the GIL while it
+    opens streams or probes devices, so every such call goes through the
+    engine and holds its lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._pya: Optional[pyaudio.PyAudio] = None
+        self._input_device: Optional[DeviceInfo] = None
+        self._output_device: Optional[DeviceInfo] = None
+        self._formats: Dict[tuple, Tuple[int, int]] = {}
+
+    @property
+    def pya(self) -> pyaudio.PyAudio:
+        """The shared PyAudio instance, initialised on first access."""
+        with self._lock:
+            if self._pya is None:
+                self._pya = pyaudio.PyAudio()
+                logger.debug("PortAudio initialised")
+            return self._pya
+
+    def default_input_device(self) -> DeviceInfo:
+        """Return the cached info of the default input device."""
+        if self._input_device is not None:
+            return self._input_device
+        with self._lock:
+            if self._input_device is None:
+                self._input_device = self.pya.get_default_input_device_info()
+            return self._input_device
+
+    def default_output_device(self) -> DeviceInfo:
+        """Return the cached info of the default output device."""
+        if self._output_device is not None:
+            return self._output_device
+        with self._lock:
+            if self._output_device is None:
+                self._output_device = self.pya.get_default_output_device_info()
+            return self._output_device
+
+    def open(self, **kwargs) -> pyaudio.Stream:
+        """Open a stream with `PyAudio.open` arguments. Blocking."""
+        with self._lock:
+            return self.pya.open(**kwargs)
+
+    def stream_format(
+        self,
+        device: DeviceInfo,
+        output: bool,
+        rate: int,
+        channels: int,
+        sample_format: int,
+    ) -> Tuple[int, int]:
+        """Pick the rate and channel count to open a device with.
+
+        The requested format is used if the device supports it, then the
+        device's default rate with the requested channels, then the
+        default rate with all of the device's channels. The answer is
+        cached per device and request.
+
+        Args:
+            device: Device info, as returned by the default device lookups
+            output: Whether the device is opened for playback
+            rate: Requested sample rate in Hz
+            channels: Requested channel count
+            sample_format: PyAudio sample format
+
+        Returns:
+            The (rate, channels) pair to open the device with
+        """
+        index = int(device["index"])
+        key = (index, output, rate, channels, sample_format)
+        with self._lock:
+            if key not in self._formats:
+                self._formats[key] = self._probe_format(
+                    device, output, rate, channels, sample_format
+                )
+            return self._formats[key]
+
+    def _probe_format(
+        self,
+        device: DeviceInfo,
+        output: bool,
+        rate: int,
+        channels: int,
+        sample_format: int,
+    ) -> Tuple[int, int]:
+        """Find the format for `stream_format`, with the lock held."""
+        index = int(device["index"])
+        direction = "output" if output else "input"
+        max_channels = int(
+            device["maxOutputChannels" if output else "maxInputChannels"]
+        )
+        native_rate = int(device["defaultSampleRate"])
+        chosen = (rate, channels)  # let opening report the failure
+        for candidate in (
+            (rate, channels),
+            (native_rate, channels),
+            (native_rate, max_channels),
+        ):
+            if not 0 < candidate[1] <= max_channels:
+                continue
+            try:
+                self.pya.is_format_supported(
+                    candidate[0],
+                    **{
+                        f"{direction}_device": index,
+                        f"{direction}_channels": candidate[1],
+                        f"{direction}_format": sample_format,
+                    },
+                )
+            except ValueError:
+                continue
+            chosen = candidate
+            break
+        return chosen
+
+    @property
+    def warm(self) -> bool:
+        """Whether PortAudio is initialised and both devices are cached."""
+        return None not in (
+            self._pya,
+            self._input_device,
+            self._output_device,
+        )
+
+    def warm_up(self):
+        """Initialise PortAudio and cache both default devices.
+
+        Blocking; meant to run on a background thread before the first
+        session starts. Failures are logged and retried on first use.
+        """
+        try:
+            self.default_input_device()
+            self.default_output_device()
+        except OSError as e:
+            logger.warning(f"Audio warm-up failed: {e}")
+
+    def terminate(self):
+        """Terminate PortAudio. Only call once no stream is open."""
+        with self._lock:
+            if self._pya is not None:
+                self._pya.terminate()
+                self._pya = None
+            self._input_device = self._output_device = None
+            self._formats.clear()
+
+
+_engine: Optional[AudioEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> AudioEngine:
+    """Return the process-wide AudioEngine, creating it on first use."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = AudioEngine()
+            atexit.register(_engine.terminate)
+        return _engine
@@ -0,0 +1,170 @@
+"""End-to-end voice latency measurement.
+
+A turn is timed from the last voiced microphone chunk to the first reply
+sample handed to the speaker, split into the stages in between:
+
+- hangover: last voiced chunk until the voice gate declares speech over
+- uplink: until the end of speech has been sent to the server
+- response: until the first reply audio arrives from the server
+- playout: until that audio is first handed to the output device
+- device: the output stream's reported latency
+
+Every hook only stores a timestamp, so tracking is cheap enough to leave
+on. Turns are completed, logged and added to the rolling percentiles on
+the event loop when the model's turn ends, or at the next end of speech
+if playout had not started by then. The percentiles are logged every few
+turns as well as at shutdown.
+"""
+
+import collections
+import logging
+import time
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional
+
+import numpy as np
+
+from eyesight.audio.config import (
+    LATENCY_LOG_EVERY_TURNS,
+    LATENCY_WINDOW_TURNS,
+)
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("hangover", "uplink", "response", "playout", "device", "total")
+
+
+@dataclass
+class TurnTimestamps:
+    """Monotonic timestamps of one user turn and its reply."""
+
+    last_voiced: float
+    speech_end: float
+    sent: Optional[float] = None
+    first_audio: Optional[float] = None
+    first_play: Optional[float] = None
+
+    def breakdown(self, device_latency: float) -> Optional[Dict[str, float]]:
+        """Stage durations in milliseconds, or None if the turn is partial."""
+        if None in (self.sent, self.first_audio, self.first_play):
+            return None
+        stages = {
+            "hangover": self.speech_end - self.last_voiced,
+            "uplink": self.sent - self.speech_end,
+            "response": self.first_audio - self.sent,
+            "playout": self.first_play - self.first_audio,
+            "device": device_latency,
+        }
+        stages["total"] = sum(stages.values())
+        return {stage: seconds * 1000 for stage, seconds in stages.items()}
+
+
+class LatencyTracker:
+    """Collects per-turn voice latency and rolling percentiles."""
+
+    def __init__(
+        self,
+        window: int = LATENCY_WINDOW_TURNS,
+        log_every: int = LATENCY_LOG_EVERY_TURNS,
+    ):
+        """
+        Args:
+            window: Number of recent turns the percentiles cover
+            log_every: Turns between logs of the percentiles; 0 logs them
+                only in `log_summary`
+        """
+        self.log_every = log_every
+        self.device_latency = 0.0
+        self.turns = 0
+        self._history: Dict[str, Deque[float]] = {
+            stage: collections.deque(maxlen=window) for stage in STAGES
+        }
+        self._turn: Optional[TurnTimestamps] = None
+
+    def speech_ended(self, last_voiced: float, now: Optional[float] = None):
+        """The voice gate closed; `last_voiced` is its last voiced chunk."""
+        now = time.monotonic() if now is None else now
+        # Close a turn that got its reply; one that did not is superseded
+        if self._turn is not None and self._turn.first_audio is not None:
+            self._finish()
+        self._turn = TurnTimestamps(last_voiced, now)
+
+    def uplink_sent(self, now: Optional[float] = None):
+        """The end of speech has been handed to the session."""
+        turn = self._turn
+        if turn is not None and turn.sent is None:
+            turn.sent = time.monotonic() if now is None else now
+
+    def downlink_audio(self, now: Optional[float] = None):
+        """Reply audio arrived from the server."""
+        turn = self._turn
+        if turn is not None and turn.sent and turn.first_audio is None:
+            turn.first_audio = time.monotonic() if now is None else now
+
+    def playout_started(self, now: Optional[float] = None):
+        """Reply audio was handed to the device. Safe from any thread."""
+        turn = self._turn
+        if turn is not None and turn.first_audio and turn.first_play is None:
+            turn.first_play = time.monotonic() if now is None else now
+
+    def turn_complete(self):
+        """The model's turn ended; record it once its audio has played.
+
+        Turns whose playout has not started yet are recorded when the next
+        speech ends instead.
+        """
+        if self._turn is not None and self._turn.first_play is not None:
+            self._finish()
+
+    def _finish(self):
+        """Close the current turn and record its breakdown, if complete."""
+        turn, self._turn = self._turn, None
+        stages = turn.breakdown(self.device_latency)
+        if stages is None:
+            return
+
+        self.turns += 1
+        for stage, ms in stages.items():
+            self._history[stage].append(ms)
+        logger.info(
+            "Turn latency %.0f ms: %s",
+            stages["total"],
+            ", ".join(
+                f"{stage} {ms:.0f}"
+                for stage, ms in stages.items()
+                if stage != "total"
+            ),
+        )
+        if self.log_every and self.turns % self.log_every == 0:
+            self._log_percentiles()
+
+    def percentiles(
+        self, stage: str = "total", quantiles=(50, 90, 99)
+    ) -> Dict[int, float]:
+        """Rolling percentiles of a stage over the recent turns, in ms."""
+        values = self._history[stage]
+        if not values:
+            return {}
+        points = np.percentile(np.fromiter(values, float), quantiles)
+        return dict(zip(quantiles, points.tolist()))
+
+    def log_summary(self):
+        """Log rolling percentiles for every stage."""
+        if self._turn is not None and self._turn.first_play is not None:
+            self._finish()
+        if self.turns:
+            self._log_percentiles()
+
+    def _log_percentiles(self):
+        """Log the rolling percentiles of every stage."""
+        logger.info(
+            "Voice latency over the last %d turns:",
+            len(self._history["total"]),
+        )
+        for stage in STAGES:
+            points = self.percentiles(stage)
+            logger.info(
+                "  %-8s %s",
+                stage,
+                " / ".join(f"p{q} {ms:.0f} ms" for q, ms in points.items()),
+            )
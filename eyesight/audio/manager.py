@@ -1,66 +1,338 @@
 import asyncio
+import collections
 import logging
 import pyaudio
-from typing import Callable, Optional, Coroutine
+from typing import (
+    Callable,
+    Deque,
+    Optional,
+    Coroutine,
+    Protocol,
+    Tuple,
+    TypeVar,
+)
 
+from eyesight.audio.convert import AudioConverter
+from eyesight.audio.engine import AudioEngine, DeviceInfo, get_engine
+from eyesight.audio.ring import AudioChunk, AudioRing
 from eyesight.config import AUDIO_CONFIG
 
+T = TypeVar("T")
+
+
+class PlayoutSource(Protocol):
+    """Pulls playback audio for the output callback, see `JitterBuffer`."""
+
+    def read(self, size: int) -> bytes:
+        """Return exactly `size` bytes of PCM, padded with silence."""
+        ...
+
 
 class AudioManager:
     """
     Manages the PyAudio instance and provides methods for opening, closing,
     capturing from, and playing to audio streams.
 
-    This class centralizes PyAudio operations and resource management.
+    This class centralizes PyAudio operations and resource management. The
+    PyAudio instance itself belongs to the process-wide AudioEngine, so
+    managers are cheap to create and closing one leaves PortAudio running.
+
+    In callback mode (`config.callback_mode`) the streams are driven by
+    PortAudio callbacks that exchange chunks with the event loop through
+    deques, whose appends and pops are atomic, instead of doing a blocking
+    read or write on an executor thread for every chunk. The loop is only
+    woken through `call_soon_threadsafe` when captured data is ready or
+    playback space frees up. Playback data is staged in a preallocated
+    AudioRing sized by `config.max_playback_seconds`.
+
+    Devices that cannot run at the Live API rates and channel counts are
+    opened in their native format when `config.native_formats` is set,
+    and audio is converted on the fly by an AudioConverter.
     """
 
-    def __init__(self, config=AUDIO_CONFIG):
+    def __init__(
+        self, config=AUDIO_CONFIG, engine: Optional[AudioEngine] = None
+    ):
         """
-        Initializes the PyAudio instance and stores the audio configuration.
+        Stores the audio configuration and the engine providing PyAudio.
         """
-        self._pya = pyaudio.PyAudio()
+        self._engine = engine if engine is not None else get_engine()
         self._config = config
         self._input_stream: Optional[pyaudio.Stream] = None
         self._output_stream: Optional[pyaudio.Stream] = None
+        self._frame_bytes = config.channels * pyaudio.get_sample_size(
+            config.format
+        )
 
-    async def open_input_stream(self) -> pyaudio.Stream:
+        # Callback-mode state
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._captured: Deque[bytes] = collections.deque(maxlen=64)
+        self._input_ready = asyncio.Event()
+        self._playback_ring = AudioRing(
+            int(
+                config.max_playback_seconds
+                * config.receive_sample_rate
+                * self._frame_bytes
+            )
+        )
+        self._pending: Deque[AudioChunk] = collections.deque()
+        self._playing: Optional[AudioChunk] = None  # owned by the callback
+        self._played = 0  # bytes of `_playing` already written out
+        self._output_waiting = False
+        self._output_space = asyncio.Event()
+        self._source: Optional[PlayoutSource] = None
+        self._abort_output = False
+        self._restart_task: Optional[asyncio.Task] = None
+        self.underruns = 0
+
+        # Device formats, set when a stream is opened
+        self._input_converter: Optional[AudioConverter] = None
+        self._input_frames = config.chunk_size
+        self._output_converter: Optional[AudioConverter] = None
+        self._output_frame_bytes = self._frame_bytes
+        self._converted = bytearray()  # converted output, owned by callback
+
+    @property
+    def input_stream(self) -> Optional[pyaudio.Stream]:
+        """The open input stream, if any."""
+        return self._input_stream
+
+    @property
+    def output_stream(self) -> Optional[pyaudio.Stream]:
+        """The open output stream, if any."""
+        return self._output_stream
+
+    async def _engine_call(self, method: Callable[[], T]) -> T:
+        """Run an engine lookup, hopping to a thread unless it is cached."""
+        if self._engine.warm:
+            return method()
+        return await asyncio.to_thread(method)
+
+    async def open_streams(
+        self, source: Optional[PlayoutSource] = None
+    ) -> Tuple[pyaudio.Stream, pyaudio.Stream]:
         """
-        Opens the default input audio stream.
+        Opens capture and playback together.
 
-        If an input stream is already open, it will be closed before opening a new one.
+        With `config.duplex` in callback mode, and both devices opened with
+        the same rate and channel count, both directions share a single
+        full-duplex stream; otherwise the two streams are opened one after
+        the other on a single worker thread, as PortAudio must not be
+        called from two threads at once.
+
+        Args:
+            source: Playback source, see `open_output_stream`.
+
+        Returns:
+            The input and output streams, which may be the same object.
         """
-        if self._input_stream is not None:
+        if self._config.duplex and self._config.callback_mode:
             self.close_input_stream()
+            self.close_output_stream()
+            mic_info = await self._engine_call(
+                self._engine.default_input_device
+            )
+            speaker_info = await self._engine_call(
+                self._engine.default_output_device
+            )
+            self._prepare_input()
+            self._prepare_output(source)
+            stream = await asyncio.to_thread(
+                self._open_duplex, mic_info, speaker_info
+            )
+            if stream is not None:
+                self._input_stream = self._output_stream = stream
+                return stream, stream
 
-        mic_info = await asyncio.to_thread(
-            self._pya.get_default_input_device_info
+        self.close_input_stream()
+        self.close_output_stream()
+        mic_info = await self._engine_call(self._engine.default_input_device)
+        speaker_info = await self._engine_call(
+            self._engine.default_output_device
+        )
+        self._prepare_input()
+        self._prepare_output(source)
+        self._input_stream, self._output_stream = await asyncio.to_thread(
+            self._open_pair, mic_info, speaker_info
+        )
+        return self._input_stream, self._output_stream
+
+    def _prepare_input(self):
+        self._loop = asyncio.get_running_loop()
+        self._captured.clear()
+
+    def _prepare_output(self, source: Optional[PlayoutSource]):
+        self._source = source
+        self._abort_output = False
+        self._loop = asyncio.get_running_loop()
+        self._pending.clear()
+        self._playing = None
+        self._playback_ring.reset()
+        self._converted.clear()
+
+    def _stream_format(
+        self, device: DeviceInfo, output: bool, rate: int
+    ) -> Tuple[int, int]:
+        """Rate and channel count to open a device with. Blocking."""
+        if not self._config.native_formats:
+            return rate, self._config.channels
+        return self._engine.stream_format(
+            device, output, rate, self._config.channels, self._config.format
+        )
+
+    def _converter(
+        self, source: Tuple[int, int], target: Tuple[int, int]
+    ) -> Optional[AudioConverter]:
+        """Build a converter between (rate, channels) formats if needed."""
+        if source == target:
+            return None
+        logging.info(
+            f"Converting audio from {source[0]} Hz x{source[1]} "
+            f"to {target[0]} Hz x{target[1]}"
+        )
+        return AudioConverter(*source, *target)
+
+    def _configure_input(self, device_format: Tuple[int, int]) -> int:
+        """Set up conversion from the input device format.
+
+        Returns:
+            Frames per device buffer, matching `chunk_size` in duration.
+        """
+        config = self._config
+        self._input_converter = self._converter(
+            device_format, (config.send_sample_rate, config.channels)
+        )
+        self._input_frames = round(
+            config.chunk_size * device_format[0] / config.send_sample_rate
+        )
+        return self._input_frames
+
+    def _configure_output(self, device_format: Tuple[int, int]) -> int:
+        """Set up conversion to the output device format.
+
+        Returns:
+            Frames per device buffer, matching `chunk_size` in duration.
+        """
+        config = self._config
+        self._output_converter = self._converter(
+            (config.receive_sample_rate, config.channels), device_format
+        )
+        self._output_frame_bytes = device_format[1] * pyaudio.get_sample_size(
+            config.format
+        )
+        return round(
+            config.chunk_size * device_format[0] / config.receive_sample_rate
+        )
+
+    def _open_duplex(
+        self, mic_info: DeviceInfo, speaker_info: DeviceInfo
+    ) -> Optional[pyaudio.Stream]:
+        """Open one stream for both directions, if their formats agree."""
+        config = self._config
+        input_format = self._stream_format(
+            mic_info, False, config.send_sample_rate
+        )
+        output_format = self._stream_format(
+            speaker_info, True, config.receive_sample_rate
         )
-        self._input_stream = await asyncio.to_thread(
-            self._pya.open,
-            format=self._config.format,
-            channels=self._config.channels,
-            rate=self._config.send_sample_rate,
+        if input_format != output_format:
+            return None
+
+        rate, channels = input_format
+        frames = self._configure_input(input_format)
+        self._configure_output(output_format)
+        return self._engine.open(
+            format=config.format,
+            channels=channels,
+            rate=rate,
+            input=True,
+            output=True,
+            input_device_index=int(mic_info["index"]),
+            output_device_index=int(speaker_info["index"]),
+            frames_per_buffer=frames,
+            stream_callback=self._on_duplex,
+        )
+
+    def _open_pair(
+        self, mic_info: DeviceInfo, speaker_info: DeviceInfo
+    ) -> Tuple[pyaudio.Stream, pyaudio.Stream]:
+        """Open the input stream, then the output stream. Blocking."""
+        input_stream = self._open_input(mic_info)
+        try:
+            return input_stream, self._open_output(speaker_info)
+        except BaseException:
+            input_stream.close()
+            raise
+
+    def _open_input(self, mic_info: DeviceInfo) -> pyaudio.Stream:
+        """Negotiate the input format and open the stream. Blocking."""
+        config = self._config
+        device_format = self._stream_format(
+            mic_info, False, config.send_sample_rate
+        )
+        frames = self._configure_input(device_format)
+        return self._engine.open(
+            format=config.format,
+            channels=device_format[1],
+            rate=device_format[0],
             input=True,
             input_device_index=int(mic_info["index"]),
-            frames_per_buffer=self._config.chunk_size,
+            frames_per_buffer=frames,
+            stream_callback=(self._on_input if config.callback_mode else None),
+        )
+
+    def _open_output(self, speaker_info: DeviceInfo) -> pyaudio.Stream:
+        """Negotiate the output format and open the stream. Blocking."""
+        config = self._config
+        device_format = self._stream_format(
+            speaker_info, True, config.receive_sample_rate
+        )
+        frames = self._configure_output(device_format)
+        return self._engine.open(
+            format=config.format,
+            channels=device_format[1],
+            rate=device_format[0],
+            output=True,
+            output_device_index=int(speaker_info["index"]),
+            frames_per_buffer=frames,
+            stream_callback=(self._on_output if config.callback_mode else None),
         )
+
+    async def open_input_stream(self) -> pyaudio.Stream:
+        """
+        Opens the default input audio stream.
+
+        If an input stream is already open, it will be closed before opening a new one.
+        """
+        if self._input_stream is not None:
+            self.close_input_stream()
+
+        mic_info = await self._engine_call(self._engine.default_input_device)
+        self._prepare_input()
+        self._input_stream = await asyncio.to_thread(self._open_input, mic_info)
         return self._input_stream
 
-    async def open_output_stream(self) -> pyaudio.Stream:
+    async def open_output_stream(
+        self, source: Optional[PlayoutSource] = None
+    ) -> pyaudio.Stream:
         """
         Opens the default output audio stream.
 
         If an output stream is already open, it will be closed before opening a new one.
+
+        Args:
+            source: In callback mode, pull playback audio from this source
+                instead of the chunks passed to `play_chunk`.
         """
         if self._output_stream is not None:
             self.close_output_stream()
 
+        speaker_info = await self._engine_call(
+            self._engine.default_output_device
+        )
+        self._prepare_output(source)
         self._output_stream = await asyncio.to_thread(
-            self._pya.open,
-            format=self._config.format,
-            channels=self._config.channels,
-            rate=self._config.receive_sample_rate,
-            output=True,
+            self._open_output, speaker_info
         )
         return self._output_stream
 
@@ -74,16 +346,29 @@ class AudioManager:
         if self._input_stream is None:
             raise RuntimeError("Input stream is not open.")
 
+        if self._config.callback_mode:
+            while not self._captured:
+                self._input_ready.clear()
+                if self._captured:
+                    break
+                await self._input_ready.wait()
+            return self._captured.popleft()
+
         kwargs = {"exception_on_overflow": False} if __debug__ else {}
         data = await asyncio.to_thread(
-            self._input_stream.read, self._config.chunk_size, **kwargs
+            self._input_stream.read, self._input_frames, **kwargs
         )
+        if self._input_converter is not None:
+            data = self._input_converter.convert(data)
         return data
 
-    async def play_chunk(self, data: bytes):
+    async def play_chunk(self, data: bytes | memoryview):
         """
         Writes a chunk of audio data to the opened output stream.
 
+        In callback mode the data is copied into the playback ring, waiting
+        while the ring is full.
+
         Args:
             data: The bytes containing the audio data to play.
 
@@ -93,12 +378,132 @@ class AudioManager:
         if self._output_stream is None:
             raise RuntimeError("Output stream is not open.")
 
-        await asyncio.to_thread(self._output_stream.write, data)
+        if not self._config.callback_mode:
+            if self._output_converter is not None:
+                data = self._output_converter.convert(data)
+            await asyncio.to_thread(self._output_stream.write, data)
+            return
+
+        ring = self._playback_ring
+        data = memoryview(data)
+        # Oversized chunks are staged in pieces so they always fit
+        step = ring.capacity // 2
+        for start in range(0, len(data), step):
+            piece = data[start : start + step]
+            while not ring.fits(len(piece)):
+                self._output_space.clear()
+                self._output_waiting = True
+                if not ring.fits(len(piece)):
+                    await self._output_space.wait()
+            self._output_waiting = False
+            self._pending.append(ring.write(piece))
+
+    def _on_input(self, in_data, frame_count, time_info, status):
+        """PortAudio input callback, run on the PortAudio thread."""
+        if self._input_converter is not None:
+            in_data = self._input_converter.convert(in_data)
+        self._captured.append(in_data)
+        self._loop.call_soon_threadsafe(self._input_ready.set)
+        return None, pyaudio.paContinue
+
+    def abort_output(self):
+        """
+        Discards the audio already handed to the output device.
+
+        In callback mode the next output callback aborts the stream, which
+        drops the device's queued buffers, and the stream is then started
+        again. Blocking streams cannot be aborted and are left alone.
+        """
+        if self._config.callback_mode and self._output_stream is not None:
+            self._abort_output = True
+
+    def _restart_output(self):
+        """Start the output stream again after a callback aborted it."""
+        if self._output_stream is not None:
+            self._restart_task = self._loop.create_task(
+                asyncio.to_thread(self._restart_stream, self._output_stream)
+            )
+
+    @staticmethod
+    def _restart_stream(stream: pyaudio.Stream):
+        try:
+            stream.stop_stream()
+            stream.start_stream()
+        except OSError as e:
+            logging.warning(f"Could not restart audio output: {e}")
+
+    def _on_duplex(self, in_data, frame_count, time_info, status):
+        """PortAudio callback of a full-duplex stream."""
+        self._on_input(in_data, frame_count, time_info, status)
+        return self._on_output(None, frame_count, time_info, status)
+
+    def _on_output(self, in_data, frame_count, time_info, status):
+        """PortAudio output callback, run on the PortAudio thread."""
+        data = self._read_output(frame_count * self._output_frame_bytes)
+        if self._abort_output:
+            self._abort_output = False
+            self._converted.clear()
+            self._loop.call_soon_threadsafe(self._restart_output)
+            return data, pyaudio.paAbort
+        return data, pyaudio.paContinue
+
+    def _read_output(self, needed: int) -> bytes:
+        """Produce `needed` bytes in the output device's format."""
+        if self._output_converter is None:
+            return self._read_source(needed)
+
+        block = self._config.chunk_size * self._frame_bytes
+        while len(self._converted) < needed:
+            self._converted += self._output_converter.convert(
+                self._read_source(block)
+            )
+        data = bytes(self._converted[:needed])
+        del self._converted[:needed]
+        return data
+
+    def _read_source(self, needed: int) -> bytes:
+        """Take `needed` bytes in the Live API format for playback."""
+        if self._source is not None:
+            return self._source.read(needed)
+        return self._fill_output(needed)
+
+    def _fill_output(self, needed: int) -> bytes:
+        """Take `needed` bytes from the pending chunks.
+
+        Pads the result with silence when playback runs dry.
+        """
+        out = bytearray(needed)
+        filled = 0
+        while filled < needed:
+            chunk = self._playing
+            if chunk is None:
+                if not self._pending:
+                    break
+                chunk = self._playing = self._pending.popleft()
+                self._played = 0
+            take = min(needed - filled, chunk.length - self._played)
+            out[filled : filled + take] = chunk.data[
+                self._played : self._played + take
+            ]
+            filled += take
+            self._played += take
+            if self._played == chunk.length:
+                chunk.release()
+                self._playing = None
+
+        if 0 < filled < needed:
+            self.underruns += 1
+        if self._output_waiting:
+            self._loop.call_soon_threadsafe(self._output_space.set)
+        return bytes(out)
 
     def close_input_stream(self):
         """
         Closes the input audio stream if it is currently open.
         """
+        if self._input_stream is self._output_stream:
+            # A duplex stream is closed with the output side
+            self._input_stream = None
         if self._input_stream is not None:
             self._input_stream.stop_stream()
             self._input_stream.close()
@@ -111,17 +516,18 @@ class AudioManager:
         if self._output_stream is not None:
             self._output_stream.stop_stream()
             self._output_stream.close()
+            if self._input_stream is self._output_stream:
+                self._input_stream = None
             self._output_stream = None
 
     def terminate(self):
         """
-        Closes any open audio streams and terminates the PyAudio instance.
+        Closes any open audio streams.
         This should be called when the AudioManager is no longer needed.
+        The shared PyAudio instance stays initialised for later sessions.
         """
         self.close_input_stream()
         self.close_output_stream()
-        if self._pya is not None:
-            self._pya.terminate()
 
     async def __aenter__(self):
         """
@@ -1,26 +1,390 @@
 """Audio playback functionality for the Eyesight application."""
 
 import asyncio
+import collections
+import contextlib
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Optional
 
+import pyaudio
 
+from eyesight.audio.config import (
+    JITTER_TARGET_SECONDS,
+    JITTER_MIN_TARGET_SECONDS,
+    JITTER_MAX_TARGET_SECONDS,
+    JITTER_DEPTH_FACTOR,
+    JITTER_CAPACITY_SECONDS,
+)
+from eyesight.audio.latency import LatencyTracker
 from eyesight.audio.manager import AudioManager, _run_audio_task
+from eyesight.audio.ring import AudioChunk, AudioRing
+from eyesight.config import AUDIO_CONFIG
 
+logger = logging.getLogger(__name__)
 
-async def play_audio(queue: asyncio.Queue):
+# Smoothing of the arrival jitter estimate, as in RFC 3550
+_JITTER_GAIN = 1 / 16
+
+# Marker queued on the downlink when the model finishes a turn
+TURN_END = object()
+
+# Marker queued on the downlink when the server reports an interruption
+INTERRUPTED = object()
+
+# Causes recorded for barge-ins
+LOCAL = "local"
+SERVER = "server"
+
+
+@dataclass
+class JitterStats:
+    """Counters kept by a JitterBuffer."""
+
+    chunks: int = 0
+    underruns: int = 0
+    late: int = 0
+    dropped: int = 0
+    max_depth: float = 0.0
+
+
+@dataclass
+class BargeInStats:
+    """Interruptions of playback and how fast they reached silence."""
+
+    causes: Counter = field(default_factory=Counter)
+    flushed: int = 0
+    discarded: int = 0
+    last_ms: float = 0.0
+    max_ms: float = 0.0
+    total_ms: float = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        """Mean interrupt-to-silence time in milliseconds."""
+        return self.total_ms / self.flushed if self.flushed else 0.0
+
+    def record(self, ms: float):
+        """Record the interrupt-to-silence time of one flush."""
+        self.flushed += 1
+        self.last_ms = ms
+        self.max_ms = max(self.max_ms, ms)
+        self.total_ms += ms
+
+
+class JitterBuffer:
+    """Adaptive playout buffer between the downlink and the speaker.
+
+    Received chunks are copied into an AudioRing by `push` on the event
+    loop, and `read` hands out exactly one device block at a time, so
+    small chunks are merged into device-sized writes and short gaps are
+    filled with silence. Each turn starts playing once the buffered audio
+    reaches the target depth or the turn has ended. The target follows an
+    estimate of how late chunks arrive compared to the audio already
+    received, so a steady network plays with little buffering and a
+    bursty one gets more.
+    Running dry before `end_turn` is an underrun, and the chunk that
+    arrives after it counts as late.
+
+    `interrupt` flushes everything pushed before it at the next `read`,
+    and calls `on_interrupt` so the owner can also drop what the device
+    holds. The time from the interrupt to that silent read is kept in
+    `barge_in`. If the interrupted turn is still being received, the rest
+    of it is discarded by `push` until that turn's `end_turn`; turns are
+    counted by `end_turn`, so a later turn is never discarded.
+
+    `push` and `read` may run on different threads: each side owns the
+    counters it writes, and the ring is single-producer/single-consumer.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = AUDIO_CONFIG.receive_sample_rate,
+        frame_bytes: Optional[int] = None,
+        target: float = JITTER_TARGET_SECONDS,
+        min_target: float = JITTER_MIN_TARGET_SECONDS,
+        max_target: float = JITTER_MAX_TARGET_SECONDS,
+        depth_factor: float = JITTER_DEPTH_FACTOR,
+        capacity: float = JITTER_CAPACITY_SECONDS,
+        latency: Optional[LatencyTracker] = None,
+    ):
+        if frame_bytes is None:
+            frame_bytes = AUDIO_CONFIG.channels * pyaudio.get_sample_size(
+                AUDIO_CONFIG.format
+            )
+        self._bytes_per_second = sample_rate * frame_bytes
+        self._base_target = target
+        self._min_target = min_target
+        self._max_target = max_target
+        self._depth_factor = depth_factor
+        self._ring = AudioRing(int(capacity * self._bytes_per_second))
+        self._chunks: Deque[AudioChunk] = collections.deque()
+        self.stats = JitterStats()
+        self.barge_in = BargeInStats()
+        self.on_interrupt: Optional[Callable[[], None]] = None
+        self.latency = latency
+        self.jitter = 0.0
+        self.target = target
+
+        # Written by push and end_turn only
+        self._pushed = 0
+        self._turn_ended = True
+        self._turns = 0
+        self._discard_turn: Optional[int] = None
+        self._last_arrival: Optional[float] = None
+        self._last_duration = 0.0
+        self._flush_requests = 0
+        self._flush_at = 0.0
+        self._flush_until = 0
+
+        # Written by read only
+        self._flushes = 0
+        self._consumed = 0
+        self._playing = False
+        self._current: Optional[AudioChunk] = None
+        self._offset = 0
+        self._starved = False
+
+    @property
+    def depth(self) -> float:
+        """Seconds of audio buffered and not yet played."""
+        return (self._pushed - self._consumed) / self._bytes_per_second
+
+    @property
+    def active(self) -> bool:
+        """Whether any audio is waiting or being played."""
+        return self._pushed > self._consumed
+
+    def push(self, data, now: Optional[float] = None):
+        """Queue a received chunk for playout.
+
+        Args:
+            data: PCM bytes from the downlink
+            now: Monotonic arrival time, defaults to the current time
+        """
+        if self._discard_turn == self._turns:
+            # Rest of an interrupted turn
+            self.barge_in.discarded += 1
+            return
+        now = time.monotonic() if now is None else now
+        self.stats.chunks += 1
+        self._turn_ended = False
+        if self._starved:
+            self._starved = False
+            self.stats.late += 1
+
+        if self._last_arrival is not None:
+            lateness = now - self._last_arrival - self._last_duration
+            # Gaps longer than any useful depth are pauses between turns
+            if lateness < self._max_target:
+                lateness = max(lateness, 0.0)
+                self.jitter += _JITTER_GAIN * (lateness - self.jitter)
+                self.target = min(
+                    max(
+                        self._base_target + self._depth_factor * self.jitter,
+                        self._min_target,
+                    ),
+                    self._max_target,
+                )
+        self._last_arrival = now
+        self._last_duration = len(data) / self._bytes_per_second
+
+        chunk = self._ring.write(data, now)
+        if chunk is None:
+            self.stats.dropped += 1
+            return
+        self._chunks.append(chunk)
+        self._pushed += len(data)
+        self.stats.max_depth = max(self.stats.max_depth, self.depth)
+
+    def end_turn(self):
+        """Mark the current turn complete so its tail plays out."""
+        self._turn_ended = True
+        self._turns += 1
+        self._last_arrival = None
+
+    def interrupt(self, cause: str, now: Optional[float] = None):
+        """Drop all buffered audio as soon as possible.
+
+        A server interruption refers to the turn it is still streaming,
+        so audio pushed after it is discarded until the next `end_turn`.
+        A local one does the same only if the pushed turn is still open;
+        replies arrive faster than real time, so the turn being played
+        has often been received in full, and the next one must be kept.
+
+        Args:
+            cause: Why playback was interrupted, `LOCAL` or `SERVER`
+            now: Monotonic time of the interruption, defaults to now
+        """
+        self.barge_in.causes[cause] += 1
+        self._flush_at = time.monotonic() if now is None else now
+        self._flush_until = self._pushed
+        if cause == SERVER or not self._turn_ended:
+            self._discard_turn = self._turns
+        # Published last, so the reading side sees the position with it
+        self._flush_requests += 1
+        self._last_arrival = None
+        if self.on_interrupt is not None:
+            self.on_interrupt()
+        logger.debug("Playback interrupted (%s)", cause)
+
+    def _flush(self):
+        """Drop the chunks pushed before the interrupt, from the reading side.
+
+        Chunks pushed after it, from a turn that began since, are kept.
+        """
+        self._flushes = self._flush_requests
+        until = self._flush_until
+        dropped = 0
+        last = self._current
+        if last is not None:
+            dropped += last.length - self._offset
+            self._current = None
+        while self._chunks and self._consumed + dropped < until:
+            last = self._chunks.popleft()
+            dropped += last.length
+        if last is not None:
+            last.release()
+        self._consumed += dropped
+        self._playing = False
+        self.barge_in.record((time.monotonic() - self._flush_at) * 1000)
+
+    def read(self, size: int) -> bytes:
+        """Return the next `size` bytes of playout, padded with silence."""
+        if self._flushes != self._flush_requests:
+            self._flush()
+            return bytes(size)
+
+        if not self._playing:
+            buffered = self._pushed - self._consumed
+            target = min(
+                self.target * self._bytes_per_second, self._ring.capacity
+            )
+            if not buffered or (not self._turn_ended and buffered < target):
+                return bytes(size)
+            self._playing = True
+            if self.latency is not None:
+                self.latency.playout_started()
+
+        out = bytearray(size)
+        filled = 0
+        while filled < size:
+            chunk = self._current
+            if chunk is None:
+                if not self._chunks:
+                    break
+                chunk = self._current = self._chunks.popleft()
+                self._offset = 0
+            take = min(size - filled, chunk.length - self._offset)
+            out[filled : filled + take] = chunk.data[
+                self._offset : self._offset + take
+            ]
+            filled += take
+            self._offset += take
+            if self._offset == chunk.length:
+                chunk.release()
+                self._current = None
+
+        self._consumed += filled
+        if filled < size:
+            # Ran dry: rebuffer to the target before playing again
+            self._playing = False
+            if not self._turn_ended:
+                self.stats.underruns += 1
+                self._starved = True
+        return bytes(out)
+
+    def log_summary(self):
+        """Log playout statistics."""
+        stats = self.stats
+        logger.info(
+            "Jitter buffer: %d chunks, %d underruns, %d late, %d dropped, "
+            "target %.0f ms, max depth %.0f ms, jitter %.1f ms",
+            stats.chunks,
+            stats.underruns,
+            stats.late,
+            stats.dropped,
+            self.target * 1000,
+            stats.max_depth * 1000,
+            self.jitter * 1000,
+        )
+        if self.barge_in.flushed:
+            logger.info(
+                "Barge-in: %s, interrupt to silence mean %.1f ms / "
+                "max %.1f ms, %d late chunks of interrupted turns discarded",
+                dict(self.barge_in.causes),
+                self.barge_in.mean_ms,
+                self.barge_in.max_ms,
+                self.barge_in.discarded,
+            )
+
+
+async def play_audio(
+    queue: asyncio.Queue,
+    jitter: Optional[JitterBuffer] = None,
+    audio_manager: Optional[AudioManager] = None,
+):
     """
     Plays audio data from the provided queue using the AudioManager.
 
+    Received chunks go through a JitterBuffer, and `TURN_END` markers
+    let it play out the tail of each turn. `INTERRUPTED` markers flush it
+    and abort the device buffer. In callback mode the output
+    callback pulls device blocks from it directly; otherwise blocks are
+    written here, with the queue drained between writes.
+
     This function runs indefinitely until cancelled.
     """
-    async with AudioManager() as audio_manager:
+    jitter = jitter if jitter is not None else JitterBuffer()
+    block_size = (
+        AUDIO_CONFIG.chunk_size
+        * AUDIO_CONFIG.channels
+        * (pyaudio.get_sample_size(AUDIO_CONFIG.format))
+    )
+
+    if audio_manager is not None:
+        manager_context = contextlib.nullcontext(audio_manager)
+    else:
+        manager_context = AudioManager()
+
+    async with manager_context as audio_manager:
+        jitter.on_interrupt = audio_manager.abort_output
+
+        async def _open():
+            stream = audio_manager.output_stream
+            stream = stream or await audio_manager.open_output_stream(jitter)
+            if jitter.latency is not None:
+                jitter.latency.device_latency = stream.get_output_latency()
+            return stream
+
+        def _push(item):
+            if item is TURN_END:
+                jitter.end_turn()
+            elif item is INTERRUPTED:
+                # Queued in order, so nothing after it is from the
+                # interrupted turn
+                jitter.interrupt(SERVER)
+                jitter.end_turn()
+            else:
+                jitter.push(item)
 
         async def _get_and_play():
-            bytestream = await queue.get()
-            await audio_manager.play_chunk(bytestream)
-
-        return await _run_audio_task(
-            audio_manager,
-            audio_manager.open_output_stream,
-            _get_and_play,
-            "Audio playback task cancelled.",
-        )
+            if AUDIO_CONFIG.callback_mode:
+                _push(await queue.get())
+                return
+            while not queue.empty():
+                _push(queue.get_nowait())
+            await audio_manager.play_chunk(jitter.read(block_size))
+
+        try:
+            return await _run_audio_task(
+                audio_manager,
+                _open,
+                _get_and_play,
+                "Audio playback task cancelled.",
+            )
+        finally:
+            jitter.on_interrupt = None
+            jitter.log_summary()
@@ -0,0 +1,132 @@
+"""Preallocated ring buffer used to move PCM audio without reallocating."""
+
+import time
+from typing import Optional
+
+
+class AudioChunk:
+    """Descriptor of one chunk stored in an AudioRing.
+
+    Chunks do not own their bytes; `data` is a memoryview into the ring
+    that stays valid until the chunk is released.
+    """
+
+    __slots__ = ("ring", "offset", "length", "timestamp", "position")
+
+    def __init__(
+        self,
+        ring: "AudioRing",
+        offset: int,
+        length: int,
+        timestamp: float,
+        position: int,
+    ):
+        self.ring = ring
+        self.offset = offset
+        self.length = length
+        self.timestamp = timestamp
+        self.position = position
+
+    @property
+    def data(self) -> memoryview:
+        """Zero-copy view of the chunk's bytes."""
+        return self.ring.view(self)
+
+    def release(self):
+        """Hand the chunk's space back to the ring."""
+        self.ring.release(self)
+
+
+class AudioRing:
+    """Single-producer, single-consumer byte ring for audio chunks.
+
+    The producer copies each chunk into a buffer allocated once up front
+    and passes the returned AudioChunk on; the consumer reads it through
+    its memoryview and releases chunks in the order they were written.
+    A chunk never wraps around the end of the buffer, so its view is
+    always contiguous. The write cursor is only advanced by the producer
+    and the read cursor only by the consumer, which lets the two sides
+    run on different threads. A full ring refuses writes instead of
+    growing, so memory stays bounded when the consumer falls behind.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity: Size of the preallocated buffer in bytes
+        """
+        if capacity <= 0:
+            raise ValueError("Ring capacity must be positive.")
+        self.capacity = capacity
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._write = 0  # absolute position, advanced by the producer
+        self._read = 0  # absolute position, advanced by the consumer
+        self.written = 0
+        self.overruns = 0
+
+    @property
+    def used(self) -> int:
+        """Bytes written and not yet released, including wrap padding."""
+        return self._write - self._read
+
+    def _start(self, length: int) -> int:
+        """Absolute position at which a chunk of `length` bytes would go."""
+        offset = self._write % self.capacity
+        if offset + length > self.capacity:
+            return self._write + self.capacity - offset
+        return self._write
+
+    def fits(self, length: int) -> bool:
+        """Whether a chunk of `length` bytes can be written right now."""
+        return self._start(length) + length - self._read <= self.capacity
+
+    def write(
+        self, data, timestamp: Optional[float] = None
+    ) -> Optional[AudioChunk]:
+        """Copy `data` into the ring.
+
+        Args:
+            data: Bytes-like PCM data
+            timestamp: Monotonic capture time, defaults to now
+
+        Returns:
+            The chunk descriptor, or None if the ring is full
+
+        Raises:
+            ValueError: If `data` is larger than the whole ring.
+        """
+        length = len(data)
+        if length > self.capacity:
+            raise ValueError(
+                f"Chunk of {length} bytes exceeds ring capacity "
+                f"{self.capacity}."
+            )
+        if not self.fits(length):
+            self.overruns += 1
+            return None
+
+        position = self._start(length)
+        offset = position % self.capacity
+        self._view[offset : offset + length] = data
+        self._write = position + length
+        self.written += 1
+        return AudioChunk(
+            self,
+            offset,
+            length,
+            time.monotonic() if timestamp is None else timestamp,
+            position,
+        )
+
+    def view(self, chunk: AudioChunk) -> memoryview:
+        """Return a zero-copy view of a chunk's bytes."""
+        return self._view[chunk.offset : chunk.offset + chunk.length]
+
+    def release(self, chunk: AudioChunk):
+        """Free a chunk and everything written before it."""
+        self._read = max(self._read, chunk.position + chunk.length)
+
+    def reset(self):
+        """Drop all chunks. Only safe while neither side is running."""
+        self._write = self._read = 0
@@ -0,0 +1,172 @@
+"""Voice-activity gating for the microphone uplink."""
+
+import collections
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Deque, List, Optional
+
+import numpy as np
+
+from eyesight.audio.config import (
+    VAD_MIN_LEVEL_DB,
+    VAD_MARGIN_DB,
+    VAD_FLOOR_RISE,
+    VAD_SPEECH_FLOOR_RISE,
+    VAD_HANGOVER_SECONDS,
+    VAD_PREROLL_SECONDS,
+    VAD_KEEPALIVE_SECONDS,
+)
+from eyesight.config import AUDIO_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Marker queued on the uplink when a stretch of speech has ended
+SPEECH_END = object()
+
+# Full-scale energy of int16 PCM
+_FULL_SCALE = 32768.0**2
+
+
+def chunk_level(data) -> float:
+    """Return the RMS level of an int16 PCM chunk in dBFS."""
+    samples = np.frombuffer(data, dtype=np.int16).astype(np.float32)
+    if not samples.size:
+        return -math.inf
+    energy = float(np.dot(samples, samples)) / samples.size
+    return 10 * math.log10(energy / _FULL_SCALE + 1e-12)
+
+
+@dataclass
+class VadStats:
+    """Counts of the chunks seen by a VoiceGate."""
+
+    speech: int = 0
+    silence: int = 0
+    forwarded: int = 0
+    keepalives: int = 0
+    segments: int = 0
+
+    @property
+    def speech_ratio(self) -> float:
+        """Fraction of chunks classified as speech."""
+        total = self.speech + self.silence
+        return self.speech / total if total else 0.0
+
+    @property
+    def forwarded_ratio(self) -> float:
+        """Fraction of chunks sent upstream, including pre-roll."""
+        total = self.speech + self.silence
+        return self.forwarded / total if total else 0.0
+
+
+def _chunks(seconds: float) -> int:
+    """Number of capture chunks covering `seconds` of audio."""
+    chunk_seconds = AUDIO_CONFIG.chunk_size / AUDIO_CONFIG.send_sample_rate
+    return math.ceil(seconds / chunk_seconds)
+
+
+@dataclass
+class VoiceGate:
+    """Energy-based voice-activity gate with hangover and pre-roll.
+
+    A chunk counts as speech when its level clears both an absolute
+    minimum and a margin above a noise floor that drops to quiet chunks
+    immediately and rises only slowly, so steady room noise is learned
+    while speech is not. The floor keeps rising, more slowly still, while
+    the gate is open, so noise that steps up and stays is learned too
+    rather than being taken for endless speech. Forwarding continues for a hangover after the
+    last voiced chunk, and the chunks heard just before an onset are
+    sent ahead of it so the start of a word is not clipped.
+    """
+
+    min_level: float = VAD_MIN_LEVEL_DB
+    margin: float = VAD_MARGIN_DB
+    floor_rise: float = VAD_FLOOR_RISE
+    speech_floor_rise: float = VAD_SPEECH_FLOOR_RISE
+    hangover_chunks: int = field(
+        default_factory=lambda: _chunks(VAD_HANGOVER_SECONDS)
+    )
+    preroll_chunks: int = field(
+        default_factory=lambda: _chunks(VAD_PREROLL_SECONDS)
+    )
+    keepalive_interval: Optional[float] = VAD_KEEPALIVE_SECONDS
+    stats: VadStats = field(default_factory=VadStats)
+    speaking: bool = field(default=False, init=False)
+    noise_floor: float = field(default=VAD_MIN_LEVEL_DB, init=False)
+    last_voiced: float = field(default=0.0, init=False)
+    _hangover: int = field(default=0, init=False, repr=False)
+    _preroll: Deque = field(init=False, repr=False)
+    _last_sent: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self):
+        self._preroll = collections.deque(maxlen=self.preroll_chunks or 1)
+
+    def is_speech(self, data) -> bool:
+        """Classify a chunk and update the noise floor."""
+        level = chunk_level(data)
+        if level < self.noise_floor:
+            self.noise_floor = level
+        else:
+            rise = self.speech_floor_rise if self.speaking else self.floor_rise
+            self.noise_floor += rise * (level - self.noise_floor)
+        return level >= max(self.min_level, self.noise_floor + self.margin)
+
+    def process(self, data, now: Optional[float] = None) -> List:
+        """Pass one captured chunk through the gate.
+
+        Args:
+            data: int16 PCM chunk
+            now: Monotonic timestamp, defaults to the current time
+
+        Returns:
+            The chunks to send upstream, oldest first; empty while silent
+        """
+        now = time.monotonic() if now is None else now
+        voiced = self.is_speech(data)
+        if voiced:
+            self.stats.speech += 1
+            self._hangover = self.hangover_chunks
+            self.last_voiced = now
+        else:
+            self.stats.silence += 1
+
+        if voiced or self._hangover > 0:
+            if not voiced:
+                self._hangover -= 1
+            if not self.speaking:
+                self.speaking = True
+                self.stats.segments += 1
+            out = [*self._preroll, data]
+            self._preroll.clear()
+        else:
+            self.speaking = False
+            if (
+                self.keepalive_interval is not None
+                and now - self._last_sent >= self.keepalive_interval
+            ):
+                self.stats.keepalives += 1
+                out = [data]
+            else:
+                if self.preroll_chunks:
+                    self._preroll.append(data)
+                return []
+
+        self.stats.forwarded += len(out)
+        self._last_sent = now
+        return out
+
+    def log_summary(self):
+        """Log speech/silence statistics."""
+        stats = self.stats
+        logger.info(
+            "Voice gate: %d speech segments, speech %.0f%% of %d chunks, "
+            "%.0f%% forwarded, %d keep-alives, noise floor %.1f dBFS",
+            stats.segments,
+            stats.speech_ratio * 100,
+            stats.speech + stats.silence,
+            stats.forwarded_ratio * 100,
+            stats.keepalives,
+            self.noise_floor,
+        )
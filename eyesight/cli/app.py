@@ -3,11 +3,21 @@
 import asyncio
 import argparse
 
-from eyesight.config import VideoMode, DEFAULT_MODE
-from eyesight.core.app import EyesightApp
+from eyesight.config import (
+    VideoMode,
+    CaptureTarget,
+    DEFAULT_MODE,
+    DEFAULT_CAPTURE_TARGET,
+)
+from eyesight.config.settings import GEMINI_CONFIG
 
 
-from eyesight.config.settings import GEMINI_CONFIG
+def _capture_target(value: str) -> CaptureTarget:
+    """Parse a --target value, reporting errors the argparse way."""
+    try:
+        return CaptureTarget.from_string(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from e
 
 
 def parse_arguments():
@@ -22,6 +32,15 @@ def parse_arguments():
         help="Source for video streaming",
         choices=[mode.value for mode in VideoMode],
     )
+    parser.add_argument(
+        "--target",
+        type=_capture_target,
+        default=DEFAULT_CAPTURE_TARGET,
+        help=(
+            "Screen area captured in screen mode: 'monitor:N', 'all', "
+            "'rect:LEFT,TOP,WIDTH,HEIGHT' or 'window:TITLE'"
+        ),
+    )
     parser.add_argument(
         "--gui",
         action="store_true",
@@ -30,13 +49,25 @@ def parse_arguments():
     return parser.parse_args()
 
 
-async def main(video_mode: VideoMode) -> None:
+async def main(
+    video_mode: VideoMode,
+    capture_target: CaptureTarget = DEFAULT_CAPTURE_TARGET,
+) -> None:
     """Main application entry point.
 
     Args:
         video_mode: The video mode to use
+        capture_target: The screen area captured in screen mode
     """
-    app = EyesightApp(gemini_config=GEMINI_CONFIG, video_mode=video_mode)
+    # Imported only once arguments are parsed: the app pulls in the Gemini
+    # SDK, PortAudio and NumPy
+    from eyesight.core.app import EyesightApp
+
+    app = EyesightApp(
+        gemini_config=GEMINI_CONFIG,
+        video_mode=video_mode,
+        capture_target=capture_target,
+    )
     await app.run()
 
 
@@ -45,11 +76,12 @@ def run_cli():
     args = parse_arguments()
 
     if args.gui:
-        # Import here to avoid circular imports
+        # Import here to avoid circular imports and to load Tk only for
+        # the GUI
         from eyesight.ui import run_gui
 
         run_gui()
     else:
         # Run in CLI mode
         video_mode = VideoMode.from_string(args.mode)
-        asyncio.run(main(video_mode))
+        asyncio.run(main(video_mode, args.target))
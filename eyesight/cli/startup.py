@@ -0,0 +1,97 @@
+"""Cold-start benchmark for the CLI.
+
+Run ``python -m eyesight.cli.startup`` to time fresh interpreters that
+import the CLI and parse ``--mode none``, which is everything that runs
+before the app starts. It fails, with a non-zero exit status, if that
+takes longer than the budget or loads any of the heavy subsystems, so it
+can guard against eager imports creeping back in.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+# Import time allowed on top of a bare interpreter start
+STARTUP_BUDGET_SECONDS: float = 0.15
+
+# Modules that must not be loaded just to parse the command line
+HEAVY_MODULES: Tuple[str, ...] = (
+    "cv2",
+    "google.genai",
+    "mss",
+    "numpy",
+    "PIL",
+    "pyaudio",
+    "tkinter",
+)
+
+_PROBE = """
+import sys
+from eyesight.cli.app import parse_arguments
+
+sys.argv = ["eyesight", "--mode", "none"]
+parse_arguments()
+print(" ".join(sys.modules))
+"""
+
+
+def _run(code: str) -> Tuple[float, str]:
+    """Run `code` in a fresh interpreter; return wall time and stdout."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return time.perf_counter() - start, result.stdout
+
+
+def measure(runs: int = 5) -> Tuple[float, List[str]]:
+    """Measure the CLI's import time over a bare interpreter start.
+
+    Args:
+        runs: Interpreters started per measurement; the median is used
+
+    Returns:
+        Median seconds spent importing, and the heavy modules loaded
+    """
+    bare = statistics.median(_run("pass")[0] for _ in range(runs))
+    times = []
+    for _ in range(runs):
+        elapsed, modules = _run(_PROBE)
+        times.append(elapsed)
+    loaded = set(modules.split())
+    heavy = [
+        name
+        for name in HEAVY_MODULES
+        if name in loaded or any(m.startswith(name + ".") for m in loaded)
+    ]
+    return max(statistics.median(times) - bare, 0.0), heavy
+
+
+def benchmark(runs: int = 5, budget: float = STARTUP_BUDGET_SECONDS) -> bool:
+    """Print the CLI cold-start time and check it against the budget.
+
+    Returns:
+        Whether the start was within budget and loaded no heavy module
+    """
+    seconds, heavy = measure(runs)
+    print(
+        f"CLI import and argument parsing: {seconds * 1000:.0f} ms "
+        f"(budget {budget * 1000:.0f} ms)"
+    )
+    if heavy:
+        print(f"Heavy modules loaded at startup: {', '.join(heavy)}")
+    return seconds <= budget and not heavy
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=STARTUP_BUDGET_SECONDS)
+    args = parser.parse_args()
+    sys.exit(0 if benchmark(args.runs, args.budget) else 1)
@@ -2,18 +2,24 @@
 
 from eyesight.config.settings import (
     VideoMode,
+    CaptureTarget,
+    CaptureTargetKind,
     AudioConfig,
     GeminiConfig,
     AUDIO_CONFIG,
     GEMINI_CONFIG,
     DEFAULT_MODE,
+    DEFAULT_CAPTURE_TARGET,
 )
 
 __all__ = [
     "VideoMode",
+    "CaptureTarget",
+    "CaptureTargetKind",
     "AudioConfig",
     "GeminiConfig",
     "AUDIO_CONFIG",
     "GEMINI_CONFIG",
     "DEFAULT_MODE",
+    "DEFAULT_CAPTURE_TARGET",
 ]
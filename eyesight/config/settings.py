@@ -4,12 +4,16 @@ import os
 import enum
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Tuple
 
-import pyaudio
-from google import genai
-from google.genai import types
 from dotenv import load_dotenv
 
+# The SDK takes most of a second to import, so it is only loaded once a
+# client or connect config is built
+if TYPE_CHECKING:
+    from google import genai
+    from google.genai import types
+
 # Load environment variables from .env file
 load_dotenv(dotenv_path=Path(__file__).resolve().parent.parent.parent / ".env")
 
@@ -18,11 +22,25 @@ load_dotenv(dotenv_path=Path(__file__).resolve().parent.parent.parent / ".env")
 class AudioConfig:
     """Audio configuration parameters."""
 
-    format: int = pyaudio.paInt16
+    # pyaudio.paInt16, spelled out so reading settings does not load
+    # PortAudio
+    format: int = 8
     channels: int = 1
     send_sample_rate: int = 16000
     receive_sample_rate: int = 24000
     chunk_size: int = 1024
+    # Use PortAudio callback streams instead of a thread hop per chunk
+    callback_mode: bool = True
+    # Playback audio buffered ahead of the device before play_chunk waits
+    max_playback_seconds: float = 2.0
+    # Open devices that cannot do the rates and channels above in their
+    # native format and convert the audio in software
+    native_formats: bool = True
+    # Share one full-duplex stream for capture and playback when both
+    # directions run at the same rate in callback mode
+    duplex: bool = False
+    # Captured audio held in the uplink ring before new chunks are dropped
+    capture_ring_seconds: float = 2.0
 
 
 @dataclass
@@ -34,16 +52,23 @@ class GeminiConfig:
     api_version: str = "v1beta"
 
     @property
-    def client(self) -> genai.Client:
-        """Initialize and return the Gemini client."""
+    def client(self) -> "genai.Client":
+        """Initialize and return a new Gemini client.
+
+        Sessions share cached clients through `eyesight.gemini.client`.
+        """
+        from google import genai
+
         return genai.Client(
             http_options={"api_version": self.api_version},
             api_key=os.environ.get("GEMINI_API_KEY"),
         )
 
     @property
-    def live_config(self) -> types.LiveConnectConfig:
-        """Create and return the LiveConnectConfig."""
+    def live_config(self) -> "types.LiveConnectConfig":
+        """Create and return a new LiveConnectConfig."""
+        from google.genai import types
+
         return types.LiveConnectConfig(
             response_modalities=[types.Modality.AUDIO],
             speech_config=types.SpeechConfig(
@@ -72,7 +97,66 @@ class VideoMode(enum.Enum):
             return cls.SCREEN  # default mode
 
 
+class CaptureTargetKind(enum.Enum):
+    """Kinds of screen region that screen mode can capture."""
+
+    MONITOR = "monitor"
+    ALL = "all"
+    RECT = "rect"
+    WINDOW = "window"
+
+
+@dataclass(frozen=True)
+class CaptureTarget:
+    """Part of the screen captured in screen mode."""
+
+    kind: CaptureTargetKind = CaptureTargetKind.MONITOR
+    monitor: int = 1
+    rect: Optional[Tuple[int, int, int, int]] = None
+    window: Optional[str] = None
+
+    @classmethod
+    def from_string(cls, value: str) -> "CaptureTarget":
+        """Parse a target such as `monitor:2`, `all`,
+        `rect:LEFT,TOP,WIDTH,HEIGHT` or `window:TITLE`.
+
+        Raises:
+            ValueError: If the target cannot be parsed
+        """
+        kind, _, arg = value.strip().partition(":")
+        try:
+            match CaptureTargetKind(kind.lower() or "monitor"):
+                case CaptureTargetKind.MONITOR:
+                    return cls(monitor=int(arg or 1))
+                case CaptureTargetKind.ALL:
+                    return cls(CaptureTargetKind.ALL)
+                case CaptureTargetKind.RECT:
+                    left, top, width, height = map(int, arg.split(","))
+                    if width <= 0 or height <= 0:
+                        raise ValueError("rect must have a positive size")
+                    return cls(
+                        CaptureTargetKind.RECT,
+                        rect=(left, top, width, height),
+                    )
+                case CaptureTargetKind.WINDOW if arg:
+                    return cls(CaptureTargetKind.WINDOW, window=arg)
+        except ValueError as e:
+            raise ValueError(f"Invalid capture target {value!r}: {e}") from e
+        raise ValueError(f"Invalid capture target {value!r}")
+
+    def __str__(self) -> str:
+        match self.kind:
+            case CaptureTargetKind.MONITOR:
+                return f"monitor:{self.monitor}"
+            case CaptureTargetKind.RECT:
+                return "rect:" + ",".join(map(str, self.rect or ()))
+            case CaptureTargetKind.WINDOW:
+                return f"window:{self.window}"
+        return self.kind.value
+
+
 # Initialize global configurations
 AUDIO_CONFIG = AudioConfig()
 GEMINI_CONFIG = GeminiConfig()
 DEFAULT_MODE = VideoMode.SCREEN
+DEFAULT_CAPTURE_TARGET = CaptureTarget()
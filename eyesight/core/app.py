@@ -7,17 +7,33 @@ from typing import Any
 
 import pyaudio
 
-from eyesight.config import VideoMode, DEFAULT_MODE
+from eyesight.config import (
+    VideoMode,
+    CaptureTarget,
+    DEFAULT_MODE,
+    DEFAULT_CAPTURE_TARGET,
+)
 from eyesight.config.settings import GeminiConfig
 from eyesight.audio.capture import capture_audio
-from eyesight.audio.playback import play_audio
-from eyesight.video.camera import capture_frames
-from eyesight.video.screen import capture_screen
+from eyesight.audio.config import LATENCY_TRACKING, VAD_ENABLED
+from eyesight.audio.latency import LatencyTracker
+from eyesight.audio.manager import AudioManager
+from eyesight.audio.playback import TURN_END, JitterBuffer, play_audio
+from eyesight.audio.vad import VoiceGate
+from eyesight.video.change import ChangeDetector
+from eyesight.video.codec import CodecSelector
+from eyesight.video.encoder import BudgetEncoder
+from eyesight.video.governor import CaptureGovernor
+from eyesight.video.pool import EncodePool
+from eyesight.video.scheduler import CaptureScheduler
+from eyesight.gemini.lanes import UplinkLanes
 from eyesight.gemini.session import (
+    AudioBatcher,
     send_text,
     send_realtime,
     receive_responses,
 )
+from eyesight.gemini.supervisor import SessionSupervisor
 
 logger = logging.getLogger(__name__)
 
@@ -28,36 +44,66 @@ class EyesightApp:
 
     gemini_config: GeminiConfig
     video_mode: VideoMode = DEFAULT_MODE
+    capture_target: CaptureTarget = DEFAULT_CAPTURE_TARGET
     audio_in_queue: asyncio.Queue = field(
         default_factory=asyncio.Queue
     )  # Initialize queue
-    out_queue: asyncio.Queue = field(
-        default_factory=lambda: asyncio.Queue(maxsize=5)
-    )  # Initialize queue with maxsize
+    # Audio lane, always sent first, and a latest-wins video slot
+    uplink: UplinkLanes = field(default_factory=UplinkLanes)
+    screen_detector: ChangeDetector = field(default_factory=ChangeDetector)
+    video_scheduler: CaptureScheduler = field(
+        default_factory=lambda: CaptureScheduler(name="Video capture")
+    )
+    video_governor: CaptureGovernor = field(default_factory=CaptureGovernor)
+    video_encoder: BudgetEncoder = field(default_factory=BudgetEncoder)
+    screen_codec: CodecSelector | None = None
+    video_pool: EncodePool = field(default_factory=EncodePool)
+    audio_manager: AudioManager = field(default_factory=AudioManager)
+    playback: JitterBuffer = field(default_factory=JitterBuffer)
+    voice_gate: VoiceGate | None = field(
+        default_factory=lambda: VoiceGate() if VAD_ENABLED else None
+    )
+    latency: LatencyTracker | None = field(
+        default_factory=lambda: LatencyTracker() if LATENCY_TRACKING else None
+    )
+    audio_batcher: AudioBatcher = field(default_factory=AudioBatcher)
+    # Reconnects the Live session; created from gemini_config if not set
+    supervisor: SessionSupervisor | None = None
     session: Any = None
     audio_stream: pyaudio.Stream | None = None
     playback_stream: pyaudio.Stream | None = None
 
+    def __post_init__(self):
+        # Screen frames pick their codec per frame; JPEG candidates share
+        # the budget encoder used for camera frames.
+        if self.screen_codec is None:
+            self.screen_codec = CodecSelector(self.video_encoder)
+        if self.playback.latency is None:
+            self.playback.latency = self.latency
+        if self.supervisor is None:
+            self.supervisor = SessionSupervisor(self.gemini_config)
+
     async def run(self) -> None:
         """Main execution loop."""
+        open_audio = None
         try:
-            # Use injected Gemini configuration
-            gemini = self.gemini_config
-
             logger.info("Connecting to Gemini API...")
 
-            async with (
-                gemini.client.aio.live.connect(
-                    model=gemini.model, config=gemini.live_config
-                ) as session,
-                asyncio.TaskGroup() as tg,
-            ):
-                logger.info("Connected to Gemini API successfully")
-                self.session = session
+            async with asyncio.TaskGroup() as tg:
+                # The supervisor runs the session-bound tasks and restarts
+                # them on every reconnect; everything started below keeps
+                # running across reconnects. It is started first so the
+                # connection handshake overlaps opening the devices.
+                tg.create_task(self.supervisor.run(self._run_session))
+                open_audio = asyncio.create_task(
+                    self.audio_manager.open_streams(self.playback)
+                )
+                await self.supervisor.wait_connected()
+                await open_audio
 
                 # Start background tasks
                 audio_capture_task, playback_task, send_text_task = (
-                    self._start_background_tasks(tg, self.session)
+                    self._start_background_tasks(tg)
                 )
 
                 # Wait for user to exit
@@ -86,6 +132,18 @@ class EyesightApp:
         except Exception:
             logger.exception("Unexpected error:")
         finally:
+            self.video_pool.shutdown()
+
+            if open_audio is not None:
+                # Let an in-flight device open finish so it gets closed
+                await asyncio.gather(open_audio, return_exceptions=True)
+            self.audio_manager.terminate()
+            self.uplink.log_summary()
+            self.audio_batcher.log_summary()
+            self.supervisor.log_summary()
+            if self.latency is not None:
+                self.latency.log_summary()
+
             # Final cleanup of audio streams if they weren't closed earlier
             if hasattr(self, "audio_stream") and self.audio_stream:
                 try:
@@ -105,32 +163,84 @@ class EyesightApp:
 
             logger.info("Application shutdown complete.")
 
-    def _start_background_tasks(self, tg: asyncio.TaskGroup, session: Any):
-        """Starts all background tasks within the task group."""
-        logger.info("Starting text input handler...")
-        send_text_task = tg.create_task(send_text(session))
+    async def _run_session(self, session: Any):
+        """Run the tasks bound to one Live session until it ends."""
+        self.session = session
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(
+                    send_realtime(
+                        session, self.uplink, self.latency, self.audio_batcher
+                    )
+                )
+                tg.create_task(
+                    receive_responses(
+                        session,
+                        self.audio_in_queue,
+                        self.latency,
+                        self.supervisor,
+                        self.playback,
+                    )
+                )
+        finally:
+            self.session = None
+            # Let a reply cut off by the disconnect play out
+            self.audio_in_queue.put_nowait(TURN_END)
 
-        logger.info("Starting realtime data handler...")
-        tg.create_task(send_realtime(session, self.out_queue))
+    def _start_background_tasks(self, tg: asyncio.TaskGroup):
+        """Starts the session-independent tasks within the task group."""
+        logger.info("Starting text input handler...")
+        send_text_task = tg.create_task(send_text(self.supervisor))
 
         logger.info("Starting audio capture...")
-        audio_capture_task = tg.create_task(capture_audio(self.out_queue))
-
-        # Start video capture based on selected mode
+        audio_capture_task = tg.create_task(
+            capture_audio(
+                self.uplink.audio,
+                self.voice_gate,
+                self.playback,
+                self.audio_manager,
+                self.latency,
+            )
+        )
+
+        # Start video capture based on selected mode; each capture module
+        # is imported only when its mode is used, so OpenCV and mss load
+        # only when needed
         if self.video_mode == VideoMode.CAMERA:
+            from eyesight.video.camera import capture_frames
+
             logger.info("Starting camera capture...")
-            tg.create_task(capture_frames(self.out_queue))
+            tg.create_task(
+                capture_frames(
+                    self.uplink.video,
+                    self.video_scheduler,
+                    self.video_governor,
+                    self.video_encoder,
+                    self.video_pool,
+                )
+            )
         elif self.video_mode == VideoMode.SCREEN:
-            logger.info("Starting screen capture...")
-            tg.create_task(capture_screen(self.out_queue))
+            from eyesight.video.screen import capture_screen
+
+            logger.info(f"Starting screen capture ({self.capture_target})...")
+            tg.create_task(
+                capture_screen(
+                    self.uplink.video,
+                    self.screen_detector,
+                    self.video_scheduler,
+                    self.video_governor,
+                    self.screen_codec,
+                    self.video_pool,
+                    self.capture_target,
+                )
+            )
         else:
             logger.info("No video capture selected")
 
-        logger.info("Starting response handler...")
-        tg.create_task(receive_responses(session, self.audio_in_queue))
-
         logger.info("Starting audio playback...")
-        playback_task = tg.create_task(play_audio(self.audio_in_queue))
+        playback_task = tg.create_task(
+            play_audio(self.audio_in_queue, self.playback, self.audio_manager)
+        )
 
         logger.info("All systems ready. You can now interact with Gemini.")
         logger.info("Type your messages at the 'message > ' prompt.")
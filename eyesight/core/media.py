@@ -0,0 +1,43 @@
+"""Media messages passed from the capture tasks to the uplink."""
+
+import time
+from typing import Optional, Union
+
+from google.genai import types
+
+
+class MediaMessage:
+    """One encoded frame or audio payload waiting to be sent.
+
+    The payload stays raw bytes (or a view of them) all the way to the
+    session; it is wrapped in a `types.Blob` exactly once, by `to_blob`,
+    and the SDK does the only encoding for the wire.
+    """
+
+    __slots__ = ("mime_type", "data", "timestamp")
+
+    def __init__(
+        self,
+        mime_type: str,
+        data: Union[bytes, memoryview],
+        timestamp: Optional[float] = None,
+    ):
+        """
+        Args:
+            mime_type: MIME type of the payload
+            data: Raw payload bytes
+            timestamp: Monotonic capture time, defaults to now
+        """
+        self.mime_type = mime_type
+        self.data = data
+        self.timestamp = time.monotonic() if timestamp is None else timestamp
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return f"MediaMessage({self.mime_type!r}, {len(self.data)} bytes)"
+
+    def to_blob(self) -> types.Blob:
+        """Wrap the payload for the SDK, copying it only if it is a view."""
+        return types.Blob(data=bytes(self.data), mime_type=self.mime_type)
@@ -4,6 +4,7 @@ This module provides the core functionality for creating and managing interactiv
 sessions with the Google Gemini API.
 """
 
+from .lanes import UplinkLanes
 from .session import (
     create_session,
     send_text,
@@ -18,4 +19,5 @@ __all__ = [
     "send_realtime",
     "receive_responses",
     "GeminiLiveSession",
+    "UplinkLanes",
 ]
@@ -0,0 +1,77 @@
+"""Process-wide cache of Gemini clients and Live connect configs."""
+
+import logging
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+from google import genai
+from google.genai import types
+
+from eyesight.config.settings import GeminiConfig
+
+logger = logging.getLogger(__name__)
+
+
+class GeminiClients:
+    """Builds each Gemini client and Live connect config once.
+
+    `GeminiConfig.client` and `GeminiConfig.live_config` construct new
+    objects on every access; building a client alone sets up its HTTP
+    transport and takes a noticeable fraction of a second. Sessions get
+    them from here instead, so only the first session in a process, or
+    `warm_up` ahead of it, pays for that.
+
+    Clients are keyed by API key and version, so a key entered in the GUI
+    between sessions gets a fresh client; connect configs are keyed by
+    the settings they are built from. Callers must not mutate the cached
+    config; copy it with `model_copy` to change it per connection.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clients: Dict[Tuple[Optional[str], str], genai.Client] = {}
+        self._live_configs: Dict[Tuple[str, str], types.LiveConnectConfig] = {}
+
+    def client(self, config: GeminiConfig) -> genai.Client:
+        """Return the cached client for the current API key."""
+        key = (os.environ.get("GEMINI_API_KEY"), config.api_version)
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = config.client
+                logger.debug("Gemini client created")
+            return self._clients[key]
+
+    def live_config(self, config: GeminiConfig) -> types.LiveConnectConfig:
+        """Return the cached Live connect config for `config`."""
+        key = (config.model, config.voice_name)
+        with self._lock:
+            if key not in self._live_configs:
+                self._live_configs[key] = config.live_config
+            return self._live_configs[key]
+
+    def warm_up(self, config: GeminiConfig):
+        """Build the client and connect config for `config`.
+
+        Blocking; meant to run on a background thread before the first
+        session starts. Failures, such as a missing API key, are logged
+        and retried on first use.
+        """
+        try:
+            self.client(config)
+            self.live_config(config)
+        except Exception as e:
+            logger.debug(f"Gemini warm-up skipped: {e}")
+
+
+_clients: Optional[GeminiClients] = None
+_clients_lock = threading.Lock()
+
+
+def get_clients() -> GeminiClients:
+    """Return the process-wide GeminiClients, creating it on first use."""
+    global _clients
+    with _clients_lock:
+        if _clients is None:
+            _clients = GeminiClients()
+        return _clients
@@ -0,0 +1,26 @@
+"""Configuration settings for the Eyesight Gemini module."""
+
+# Ask the server for session resumption handles so a dropped or expiring
+# session can be continued with its context on a new connection
+SESSION_RESUMPTION: bool = True
+
+# Consecutive failed connection attempts before giving up; 0 disables
+# reconnecting, so the first disconnect ends the application
+RECONNECT_MAX_ATTEMPTS: int = 8
+
+# Delay before the first reconnection attempt, doubled after each failure
+RECONNECT_INITIAL_BACKOFF_SECONDS: float = 0.25
+
+# Upper bound of the reconnection backoff
+RECONNECT_MAX_BACKOFF_SECONDS: float = 8.0
+
+# How long a session must stay up before the failure count and backoff
+# reset; sessions closed sooner count as failed attempts
+RECONNECT_STABLE_SECONDS: float = 10.0
+
+# WebSocket close codes after which reconnecting can succeed: normal
+# closure (session limits), going away, abnormal closure and the server
+# side 1011-1014 errors
+RECONNECT_CLOSE_CODES: frozenset = frozenset(
+    {1000, 1001, 1006, 1011, 1012, 1013, 1014}
+)
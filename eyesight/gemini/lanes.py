@@ -0,0 +1,109 @@
+"""Per-modality uplink lanes feeding the Gemini session."""
+
+import asyncio
+import logging
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class AudioLane(asyncio.Queue):
+    """Unbounded FIFO for audio; nothing put here is ever dropped.
+
+    Memory stays bounded upstream, by the capture ring.
+    """
+
+    def __init__(self, notify: Callable[[], None]):
+        super().__init__()
+        self._notify = notify
+        self.sent = 0
+
+    def put_nowait(self, item: Any):
+        super().put_nowait(item)
+        self._notify()
+
+
+class VideoSlot:
+    """Single latest-wins slot for video frames.
+
+    A frame put while the previous one is still unsent replaces it, and
+    the stale frame is counted in `dropped`. It offers the parts of the
+    asyncio.Queue interface used by the capture loops and `queue_fill`.
+    """
+
+    maxsize = 1
+
+    def __init__(self, notify: Callable[[], None]):
+        self._notify = notify
+        self._frame: Any = None
+        self._full = False
+        self.sent = 0
+        self.dropped = 0
+
+    def qsize(self) -> int:
+        """1 while a frame is waiting to be sent, else 0."""
+        return int(self._full)
+
+    def empty(self) -> bool:
+        """Whether no frame is waiting."""
+        return not self._full
+
+    def put_nowait(self, frame: Any):
+        """Store a frame, replacing any unsent one."""
+        if self._full:
+            self.dropped += 1
+        self._frame = frame
+        self._full = True
+        self._notify()
+
+    async def put(self, frame: Any):
+        """Store a frame; never waits."""
+        self.put_nowait(frame)
+
+    def get_nowait(self) -> Any:
+        """Take the waiting frame.
+
+        Raises:
+            asyncio.QueueEmpty: If no frame is waiting.
+        """
+        if not self._full:
+            raise asyncio.QueueEmpty
+        frame, self._frame = self._frame, None
+        self._full = False
+        return frame
+
+
+class UplinkLanes:
+    """Separate audio and video lanes drained by one sender.
+
+    `get` always returns queued audio first and only then the latest video
+    frame, so speech never waits behind frames that are still queued and
+    screen activity cannot delay it beyond the frame being sent.
+    """
+
+    def __init__(self):
+        self._ready = asyncio.Event()
+        self.audio = AudioLane(self._ready.set)
+        self.video = VideoSlot(self._ready.set)
+
+    async def get(self) -> Any:
+        """Wait for the next message, audio before video."""
+        while True:
+            if not self.audio.empty():
+                self.audio.sent += 1
+                return self.audio.get_nowait()
+            if not self.video.empty():
+                self.video.sent += 1
+                return self.video.get_nowait()
+            self._ready.clear()
+            await self._ready.wait()
+
+    def log_summary(self):
+        """Log per-lane message counts."""
+        logger.info(
+            "Uplink: %d audio messages, %d video frames sent, "
+            "%d stale frames dropped",
+            self.audio.sent,
+            self.video.sent,
+            self.video.dropped,
+        )
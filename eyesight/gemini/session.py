@@ -1,21 +1,153 @@
 """Gemini API session management for the Eyesight application."""
 
 import asyncio
-from typing import Any, TypeAlias, AsyncIterator
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    TypeAlias,
+    AsyncIterator,
+    List,
+    Optional,
+)
 
+import pyaudio
 from google.genai import types
 from contextlib import asynccontextmanager
 
-from eyesight.config import GEMINI_CONFIG
+from eyesight.audio.config import (
+    AUDIO_BATCH_WINDOW_SECONDS,
+    AUDIO_BATCH_MAX_SECONDS,
+)
+from eyesight.audio.latency import LatencyTracker
+from eyesight.audio.playback import (
+    INTERRUPTED,
+    SERVER,
+    TURN_END,
+    JitterBuffer,
+)
+from eyesight.audio.ring import AudioChunk
+from eyesight.audio.vad import SPEECH_END
+from eyesight.config import AUDIO_CONFIG, GEMINI_CONFIG
+from eyesight.core.media import MediaMessage
+from eyesight.gemini.client import get_clients
+from eyesight.gemini.lanes import UplinkLanes
+
+if TYPE_CHECKING:
+    from eyesight.gemini.supervisor import SessionSupervisor
 
 GeminiLiveSession: TypeAlias = Any
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchStats:
+    """Uplink audio messages sent by an AudioBatcher."""
+
+    messages: int = 0
+    chunks: int = 0
+    max_delay_ms: float = 0.0
+    total_delay_ms: float = 0.0
+
+    @property
+    def chunks_per_message(self) -> float:
+        """Mean number of capture chunks merged into one message."""
+        return self.chunks / self.messages if self.messages else 0.0
+
+    @property
+    def mean_delay_ms(self) -> float:
+        """Mean time the first chunk of a message waited for the rest."""
+        return self.total_delay_ms / self.messages if self.messages else 0.0
+
+
+@dataclass
+class AudioBatcher:
+    """Coalesces consecutive audio chunks into fewer uplink messages.
+
+    A batch is flushed when it holds `max_bytes` of audio, when
+    `window` seconds have passed since its first chunk, or as soon as
+    anything other than audio is sent, such as the end of speech.
+    """
+
+    window: float = AUDIO_BATCH_WINDOW_SECONDS
+    mime_type: str = field(
+        default_factory=lambda: (
+            f"audio/pcm;rate={AUDIO_CONFIG.send_sample_rate}"
+        )
+    )
+    max_bytes: int = field(
+        default_factory=lambda: int(
+            AUDIO_BATCH_MAX_SECONDS
+            * AUDIO_CONFIG.send_sample_rate
+            * AUDIO_CONFIG.channels
+            * pyaudio.get_sample_size(AUDIO_CONFIG.format)
+        )
+    )
+    stats: BatchStats = field(default_factory=BatchStats)
+    _chunks: List[AudioChunk] = field(default_factory=list, init=False)
+    _size: int = field(default=0, init=False)
+    _started: float = field(default=0.0, init=False)
+
+    @property
+    def pending(self) -> bool:
+        """Whether a batch has been started."""
+        return bool(self._chunks)
+
+    @property
+    def deadline(self) -> float:
+        """Monotonic time by which the current batch must be sent."""
+        return self._started + self.window
+
+    def add(self, chunk: AudioChunk) -> bool:
+        """Add a chunk to the batch.
+
+        Returns:
+            True if the batch should be sent right away
+        """
+        if not self._chunks:
+            self._started = time.monotonic()
+        self._chunks.append(chunk)
+        self._size += chunk.length
+        return self._size >= self.max_bytes or self.window <= 0
+
+    def take(self) -> MediaMessage:
+        """Merge the batch into one message and release its chunks."""
+        data = b"".join([chunk.data for chunk in self._chunks])
+        message = MediaMessage(self.mime_type, data, self._chunks[0].timestamp)
+        for chunk in self._chunks:
+            chunk.release()
+
+        delay_ms = (time.monotonic() - self._started) * 1000
+        self.stats.messages += 1
+        self.stats.chunks += len(self._chunks)
+        self.stats.max_delay_ms = max(self.stats.max_delay_ms, delay_ms)
+        self.stats.total_delay_ms += delay_ms
+        self._chunks.clear()
+        self._size = 0
+        return message
+
+    def log_summary(self):
+        """Log how much batching reduced the audio message rate."""
+        stats = self.stats
+        logger.info(
+            "Audio uplink: %d messages, %.1f chunks per message, "
+            "added delay mean %.1f ms / max %.1f ms",
+            stats.messages,
+            stats.chunks_per_message,
+            stats.mean_delay_ms,
+            stats.max_delay_ms,
+        )
+
 
 async def send_text(session: GeminiLiveSession) -> None:
     """Handle text input from user and send to Gemini.
 
     Args:
-        session: Gemini API session
+        session: Gemini API session, or a SessionSupervisor forwarding to
+            the current one
 
     Returns:
         None when user exits
@@ -33,41 +165,111 @@ async def send_text(session: GeminiLiveSession) -> None:
 
 
 async def send_realtime(
-    session: GeminiLiveSession, queue: asyncio.Queue
+    session: GeminiLiveSession,
+    queue: UplinkLanes | asyncio.Queue,
+    latency: Optional[LatencyTracker] = None,
+    batcher: Optional[AudioBatcher] = None,
 ) -> None:
     """Send queued messages to Gemini API.
 
+    Audio arrives as AudioChunk descriptors into the capture ring.
+    Consecutive chunks are merged by an AudioBatcher, copied out once for
+    the SDK and released. `SPEECH_END` from the voice gate flushes the
+    batch and is sent as an audio stream end, so the server does not wait
+    for audio that the gate holds back. Video frames arrive as
+    MediaMessages holding raw encoded bytes and are wrapped as a Blob here
+    without any further encoding.
+
     Args:
         session: Gemini API session
-        queue: Queue containing messages to send
+        queue: Uplink lanes, or a single queue, containing messages to send
+        latency: Tracker told when the end of speech has been sent
+        batcher: Audio batcher, kept across reconnects by the caller; a
+            private one with the default window is used if omitted
     """
-    while True:
-        msg = await queue.get()
-        if "mime_type" in msg:
-            await session.send_realtime_input(media=msg)
+    own_batcher = batcher is None
+    batcher = batcher if batcher is not None else AudioBatcher()
+
+    async def _flush():
+        if batcher.pending:
+            message = batcher.take()
+            await session.send_realtime_input(media=message.to_blob())
+
+    try:
+        while True:
+            if batcher.pending:
+                try:
+                    msg = await asyncio.wait_for(
+                        queue.get(), batcher.deadline - time.monotonic()
+                    )
+                except TimeoutError:
+                    await _flush()
+                    continue
+            else:
+                msg = await queue.get()
+
+            if isinstance(msg, AudioChunk):
+                if batcher.add(msg):
+                    await _flush()
+                continue
+
+            await _flush()
+            if msg is SPEECH_END:
+                await session.send_realtime_input(audio_stream_end=True)
+                if latency is not None:
+                    latency.uplink_sent()
+            elif isinstance(msg, MediaMessage):
+                await session.send_realtime_input(media=msg.to_blob())
+    finally:
+        if own_batcher:
+            batcher.log_summary()
 
 
 async def receive_responses(
-    session: GeminiLiveSession, audio_queue: asyncio.Queue
+    session: GeminiLiveSession,
+    audio_queue: asyncio.Queue,
+    latency: Optional[LatencyTracker] = None,
+    supervisor: Optional["SessionSupervisor"] = None,
+    playback: Optional[JitterBuffer] = None,
 ) -> None:
     """Read responses from Gemini API and process them.
 
     Args:
         session: Gemini API session
         audio_queue: Queue to add audio responses to
+        latency: Tracker told about reply audio and turn ends
+        supervisor: Supervisor shown every message, for resumption
+            handles and go-away notices
+        playback: Jitter buffer interrupted directly when the server
+            reports an interruption; without it an `INTERRUPTED` marker
+            is queued instead
     """
     while True:
         turn = session.receive()
         async for response in turn:
+            if supervisor is not None:
+                supervisor.observe(response)
+            content = response.server_content
+            if content is not None and content.interrupted:
+                # Stop playback now rather than when the turn ends, and
+                # without waiting behind audio still in the queue
+                if playback is not None:
+                    playback.interrupt(SERVER)
+                else:
+                    audio_queue.put_nowait(INTERRUPTED)
             if data := response.data:
+                if latency is not None:
+                    latency.downlink_audio()
                 audio_queue.put_nowait(data)
                 continue
             if text := response.text:
                 print(text, end="")
 
-        # Clear queue on interruption for better responsiveness
-        while not audio_queue.empty():
-            audio_queue.get_nowait()
+        # Queued audio belongs to the jitter buffer now: the marker lets the
+        # tail of the turn play out, and interruptions flush it instead
+        audio_queue.put_nowait(TURN_END)
+        if latency is not None:
+            latency.turn_complete()
 
 
 @asynccontextmanager
@@ -78,7 +280,8 @@ async def create_session() -> AsyncIterator[GeminiLiveSession]:
         Gemini API session
     """
     gemini = GEMINI_CONFIG
-    async with gemini.client.aio.live.connect(
-        model=gemini.model, config=gemini.live_config
+    clients = get_clients()
+    async with clients.client(gemini).aio.live.connect(
+        model=gemini.model, config=clients.live_config(gemini)
     ) as session:
         yield session
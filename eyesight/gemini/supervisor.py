@@ -0,0 +1,333 @@
+"""Reconnecting supervisor for Gemini Live sessions."""
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+from google.genai import errors, types
+from websockets.exceptions import ConnectionClosed
+
+from eyesight.config.settings import GeminiConfig
+from eyesight.gemini.client import GeminiClients, get_clients
+from eyesight.gemini.config import (
+    SESSION_RESUMPTION,
+    RECONNECT_MAX_ATTEMPTS,
+    RECONNECT_INITIAL_BACKOFF_SECONDS,
+    RECONNECT_MAX_BACKOFF_SECONDS,
+    RECONNECT_STABLE_SECONDS,
+    RECONNECT_CLOSE_CODES,
+)
+
+logger = logging.getLogger(__name__)
+
+SessionMain = Callable[[Any], Awaitable[None]]
+
+
+def is_recoverable(exc: BaseException) -> bool:
+    """Whether a session error is a lost connection worth reconnecting."""
+    if isinstance(exc, errors.APIError):
+        # The SDK raises with whatever code the server sent, possibly none
+        code = exc.code
+        return code in RECONNECT_CLOSE_CODES or (
+            isinstance(code, int) and 500 <= code < 600
+        )
+    return isinstance(exc, (ConnectionClosed, OSError))
+
+
+def _connection_error(exc: Exception) -> Optional[BaseException]:
+    """The lost-connection error behind `exc`, or None if it is another."""
+    if isinstance(exc, ExceptionGroup):
+        lost, other = exc.split(is_recoverable)
+        return lost.exceptions[0] if other is None else None
+    return exc if is_recoverable(exc) else None
+
+
+def _handle_rejected(exc: Exception) -> bool:
+    """Whether a failed resumed connect was the server refusing it.
+
+    Transport errors, and close codes worth reconnecting after, say nothing
+    about the handle, which is kept for the next attempt.
+    """
+    return isinstance(exc, errors.APIError) and not is_recoverable(exc)
+
+
+@dataclass
+class ReconnectStats:
+    """Connection times and disconnects handled by a SessionSupervisor."""
+
+    connect_ms: float = 0.0
+    reconnects: int = 0
+    resumed: int = 0
+    failed_attempts: int = 0
+    total_gap_ms: float = 0.0
+    max_gap_ms: float = 0.0
+
+    @property
+    def mean_gap_ms(self) -> float:
+        """Mean time from disconnect to the next connected session."""
+        return self.total_gap_ms / self.reconnects if self.reconnects else 0.0
+
+
+class SessionSupervisor:
+    """Keeps a Live session connected for the lifetime of the app.
+
+    `run` connects, hands the session to a session-scoped coroutine and,
+    when the connection drops, the server announces it is going away or
+    the session hits its time limit, connects again with exponential
+    backoff. The latest resumption handle the server sent is passed on
+    reconnect so the conversation continues where it left off. It is kept
+    across transport errors during an outage; if the server refuses the
+    resumed connect, the handle is dropped and the next attempt starts a
+    new session.
+
+    Only the session-scoped work is restarted; capture and playback keep
+    running against the uplink lanes and playback queue, which buffer in
+    a bounded way during the gap. The supervisor also forwards
+    `send_client_content` to whichever session is current, so the text
+    prompt can hold on to it across reconnects.
+    """
+
+    def __init__(
+        self,
+        config: GeminiConfig,
+        max_attempts: int = RECONNECT_MAX_ATTEMPTS,
+        initial_backoff: float = RECONNECT_INITIAL_BACKOFF_SECONDS,
+        max_backoff: float = RECONNECT_MAX_BACKOFF_SECONDS,
+        stable_seconds: float = RECONNECT_STABLE_SECONDS,
+        resumption: bool = SESSION_RESUMPTION,
+        clients: Optional[GeminiClients] = None,
+    ):
+        """
+        Args:
+            config: Gemini configuration to connect with
+            max_attempts: Consecutive failed attempts before giving up;
+                0 disables reconnecting
+            initial_backoff: Delay before the first reconnection attempt
+            max_backoff: Upper bound of the doubling backoff
+            stable_seconds: Time a session must stay up for the failure
+                count to reset; shorter sessions count as failures
+            resumption: Whether to request and use resumption handles
+            clients: Client cache, the process-wide one if omitted
+        """
+        self.config = config
+        self.clients = clients if clients is not None else get_clients()
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.stable_seconds = stable_seconds
+        self.resumption = resumption
+        self.handle: Optional[str] = None
+        self.session: Any = None
+        self.stats = ReconnectStats()
+        self._connected = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._going_away = False
+        self._disconnected_at = 0.0
+        self._attempts = 0
+
+    def _live_config(self) -> types.LiveConnectConfig:
+        """Connection config carrying the current resumption handle."""
+        live_config = self.clients.live_config(self.config)
+        if self.resumption:
+            live_config = live_config.model_copy(
+                update={
+                    "session_resumption": types.SessionResumptionConfig(
+                        handle=self.handle
+                    )
+                }
+            )
+        return live_config
+
+    def observe(self, response: types.LiveServerMessage):
+        """Track resumption handles and go-away notices from the server."""
+        update = response.session_resumption_update
+        if update is not None and update.resumable and update.new_handle:
+            self.handle = update.new_handle
+        if (
+            response.go_away is not None
+            and not self._going_away
+            and self.max_attempts > 0
+        ):
+            logger.info(
+                "Server is closing the session (time left: %s); reconnecting",
+                response.go_away.time_left,
+            )
+            # Reconnect now, while the handle is fresh, instead of waiting
+            # for the connection to be cut
+            self._going_away = True
+            if self._task is not None:
+                self._task.cancel()
+
+    async def wait_connected(self) -> Any:
+        """Wait until a session is connected and return it."""
+        await self._connected.wait()
+        return self.session
+
+    async def send_client_content(self, **kwargs):
+        """Send client content on the current session.
+
+        Waits while reconnecting. Content that cannot be sent because the
+        connection drops is logged and dropped.
+        """
+        session = await self.wait_connected()
+        try:
+            await session.send_client_content(**kwargs)
+        except Exception as e:
+            if not is_recoverable(e):
+                raise
+            logger.warning(f"Message not sent, connection lost: {e}")
+
+    async def run(self, session_main: SessionMain):
+        """Run `session_main(session)` on a connected session, forever.
+
+        Returns if `session_main` returns on its own.
+
+        Raises:
+            Exception: The session error, if it is not a lost connection
+                or reconnecting failed `max_attempts` times in a row.
+        """
+        self._attempts = 0
+        first = True
+        started = time.monotonic()
+        while True:
+            resuming = self.handle is not None
+            connected_at: Optional[float] = None
+            went_away = False
+            try:
+                client = self.clients.client(self.config)
+                async with client.aio.live.connect(
+                    model=self.config.model, config=self._live_config()
+                ) as session:
+                    connected_at = time.monotonic()
+                    if first:
+                        self.stats.connect_ms = (connected_at - started) * 1000
+                        logger.info(
+                            "Connected to Gemini API successfully in %.0f ms",
+                            self.stats.connect_ms,
+                        )
+                    else:
+                        self._record_gap(resuming)
+                    first = False
+                    if await self._serve(session, session_main):
+                        return
+                    went_away = True
+            except Exception as e:
+                lost = _connection_error(e)
+                if resuming and connected_at is None and _handle_rejected(e):
+                    # The handle expired or was rejected; start a new
+                    # session rather than resending it on every retry
+                    self.handle = None
+                    logger.warning(
+                        f"Resuming the Gemini session failed ({e}); "
+                        "starting a new session"
+                    )
+                elif lost is None:
+                    raise
+                elif connected_at is None:
+                    logger.warning(f"Gemini connection attempt failed: {lost}")
+                else:
+                    logger.warning(f"Gemini connection lost: {lost}")
+                if self._count_failure(connected_at):
+                    raise
+            finally:
+                self._connected.clear()
+                self.session = None
+
+            if went_away and self._count_failure(connected_at):
+                raise ConnectionError(
+                    "Gemini sessions keep closing right after connecting"
+                )
+            if self._attempts:
+                backoff = min(
+                    self.initial_backoff * 2 ** (self._attempts - 1),
+                    self.max_backoff,
+                )
+                # Full jitter, so many clients do not retry in lockstep
+                await asyncio.sleep(random.uniform(0, backoff))
+
+    def _count_failure(self, connected_at: Optional[float]) -> bool:
+        """Account for a session that ended or failed to connect.
+
+        A session that stayed up for `stable_seconds` resets the failure
+        count; one that failed to connect or closed sooner adds to it, so
+        a server that accepts and immediately closes still gets backoff.
+
+        Args:
+            connected_at: Monotonic connect time, None if it failed
+
+        Returns:
+            Whether to give up reconnecting
+        """
+        if (
+            connected_at is not None
+            and time.monotonic() - connected_at >= self.stable_seconds
+        ):
+            self._attempts = 0
+            return self.max_attempts <= 0
+        self._attempts += 1
+        self.stats.failed_attempts += 1
+        return self._attempts >= self.max_attempts
+
+    async def _serve(self, session: Any, session_main: SessionMain) -> bool:
+        """Run the session-scoped work until it ends.
+
+        Returns:
+            True if `session_main` returned, False if the server asked to
+            reconnect
+
+        Raises:
+            Exception: Whatever `session_main` raised.
+        """
+        self.session = session
+        self._going_away = False
+        self._task = asyncio.create_task(session_main(session))
+        self._connected.set()
+        try:
+            await asyncio.wait([self._task])
+        except asyncio.CancelledError:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            raise
+        finally:
+            task, self._task = self._task, None
+            self._disconnected_at = time.monotonic()
+
+        if task.cancelled():
+            if self._going_away:
+                return False
+            raise asyncio.CancelledError
+        if task.exception() is not None:
+            raise task.exception()
+        return True
+
+    def _record_gap(self, resumed: bool):
+        """Record and log the time from disconnect to a new session."""
+        gap_ms = (time.monotonic() - self._disconnected_at) * 1000
+        stats = self.stats
+        stats.reconnects += 1
+        stats.resumed += resumed
+        stats.total_gap_ms += gap_ms
+        stats.max_gap_ms = max(stats.max_gap_ms, gap_ms)
+        logger.info(
+            "Reconnected to Gemini API in %.0f ms (%s)",
+            gap_ms,
+            "session resumed" if resumed else "new session",
+        )
+
+    def log_summary(self):
+        """Log reconnect counts and disconnect-to-resumed times."""
+        stats = self.stats
+        if not stats.reconnects and not stats.failed_attempts:
+            return
+        logger.info(
+            "Gemini reconnects: %d (%d resumed), %d failed attempts, "
+            "gap mean %.0f ms / max %.0f ms",
+            stats.reconnects,
+            stats.resumed,
+            stats.failed_attempts,
+            stats.mean_gap_ms,
+            stats.max_gap_ms,
+        )
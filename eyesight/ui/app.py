@@ -6,7 +6,7 @@ from tkinter import ttk, messagebox
 import signal
 import threading
 
-from eyesight.config import VideoMode
+from eyesight.config import VideoMode, CaptureTarget, DEFAULT_CAPTURE_TARGET
 from eyesight.ui.app_manager import AppLifecycleManager
 
 
@@ -27,6 +27,7 @@ class EyesightGUI:
 
         # UI variables
         self.video_mode = tk.StringVar(value=VideoMode.SCREEN.value)
+        self.capture_target = tk.StringVar(value=str(DEFAULT_CAPTURE_TARGET))
         self.api_key = tk.StringVar(
             value=os.environ.get("GEMINI_API_KEY", "")
         )  # Populate from env directly
@@ -87,6 +88,15 @@ class EyesightGUI:
                 variable=self.video_mode,
             ).pack(anchor=tk.W, pady=5)
 
+        ttk.Label(
+            mode_frame,
+            text="Screen target (monitor:N, all, rect:L,T,W,H, window:TITLE)",
+            wraplength=250,
+        ).pack(anchor=tk.W, pady=(5, 0))
+        ttk.Entry(mode_frame, textvariable=self.capture_target).pack(
+            fill=tk.X, pady=5
+        )
+
     def _build_api_frame(self, parent_frame):
         """Build the API key input frame."""
         api_frame = ttk.LabelFrame(
@@ -116,7 +126,8 @@ class EyesightGUI:
         instructions_text = """1. Enter your Gemini API Key
 2. Select a video mode:
    • Camera: Uses your webcam
-   • Screen: Captures your screen
+   • Screen: Captures your screen, or the
+     monitor, region or window set as target
    • None: Audio only
 3. Click 'Start Eyesight'
 4. Interact with Gemini in the console
@@ -197,8 +208,15 @@ class EyesightGUI:
         # Set the API key in environment for the core app to pick up
         os.environ["GEMINI_API_KEY"] = api_key
 
-        # Get the selected video mode
+        # Get the selected video mode and screen target
         video_mode = VideoMode.from_string(self.video_mode.get())
+        try:
+            capture_target = CaptureTarget.from_string(
+                self.capture_target.get()
+            )
+        except ValueError as e:
+            messagebox.showerror("Invalid Screen Target", str(e))
+            return
 
         # Print a message to the console
         print("\n" + "-" * 50)
@@ -212,7 +230,7 @@ class EyesightGUI:
         )  # Disable while starting
 
         # Start the app using the manager
-        self._app_manager.start(api_key, video_mode)
+        self._app_manager.start(api_key, video_mode, capture_target)
 
     def _stop_app(self):
         """Stop the Eyesight application."""
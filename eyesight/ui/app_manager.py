@@ -4,13 +4,28 @@ import asyncio
 import threading
 import os
 
-from eyesight.core.app import EyesightApp
 from eyesight.config import (
     VideoMode,
+    CaptureTarget,
     GEMINI_CONFIG,
+    DEFAULT_CAPTURE_TARGET,
 )
 
 
+def _warm_audio():
+    """Initialise PortAudio and look up the audio devices."""
+    from eyesight.audio.engine import get_engine
+
+    get_engine().warm_up()
+
+
+def _warm_gemini():
+    """Import the Gemini SDK and build the client and connect config."""
+    from eyesight.gemini.client import get_clients
+
+    get_clients().warm_up(GEMINI_CONFIG)
+
+
 class AppLifecycleManager:
     """Manages the lifecycle (start, stop, thread, loop) of the EyesightApp."""
 
@@ -32,12 +47,25 @@ class AppLifecycleManager:
         self._on_error = on_error
         self._on_stopped = on_stopped
 
-    def start(self, api_key: str, video_mode: VideoMode):
+        # Initialise PortAudio, look up the audio devices and build the
+        # Gemini client up front, so pressing Start only has to open the
+        # streams and the connection. The imports happen on these threads
+        # too, so the window is not held up by them.
+        threading.Thread(target=_warm_audio, daemon=True).start()
+        threading.Thread(target=_warm_gemini, daemon=True).start()
+
+    def start(
+        self,
+        api_key: str,
+        video_mode: VideoMode,
+        capture_target: CaptureTarget = DEFAULT_CAPTURE_TARGET,
+    ):
         """Start the Eyesight application in a separate thread.
 
         Args:
             api_key: The Gemini API key (set in environment).
             video_mode: The selected video mode.
+            capture_target: The screen area captured in screen mode.
         """
         if self._is_running:
             print("App is already running.")
@@ -48,7 +76,7 @@ class AppLifecycleManager:
 
         self._is_running = True
         self._app_thread = threading.Thread(
-            target=self._run_app_thread, args=(video_mode,)
+            target=self._run_app_thread, args=(video_mode, capture_target)
         )
         self._app_thread.daemon = (
             True  # Allow main thread to exit even if this thread is running
@@ -96,13 +124,19 @@ class AppLifecycleManager:
             self._app_loop.stop()
             print("Asyncio loop stopped.")
 
-    def _run_app_thread(self, video_mode: VideoMode):
+    def _run_app_thread(
+        self, video_mode: VideoMode, capture_target: CaptureTarget
+    ):
         """Run the Eyesight app within a separate thread."""
         try:
+            from eyesight.core.app import EyesightApp
+
             # Create the app and event loop
             # Pass the imported GEMINI_CONFIG
             self._app = EyesightApp(
-                gemini_config=GEMINI_CONFIG, video_mode=video_mode
+                gemini_config=GEMINI_CONFIG,
+                video_mode=video_mode,
+                capture_target=capture_target,
             )
 
             # Create a new event loop for this thread
@@ -141,7 +175,8 @@ class AppLifecycleManager:
             self._app = None  # Dereference the app
 
         # Close the event loop safely
-        # PyAudio instances should be terminated when their AudioManager context managers exit
+        # The shared PyAudio instance stays alive for the next session and
+        # is terminated at process exit
         if self._app_loop and not self._app_loop.is_closed():
             try:
                 self._app_loop.close()
@@ -4,55 +4,354 @@ This module is untested and may not work as expected.
 """
 
 import asyncio
-from typing import Optional, Dict
+import concurrent.futures
+import io
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Tuple
 import logging
 
 import cv2  # type: ignore
+import numpy as np
 from PIL import Image  # type: ignore
 
+from eyesight.core.media import MediaMessage
+from eyesight.video.config import (
+    CAMERA_DEVICE_INDEX,
+    CAMERA_OPEN_TIMEOUT_SECONDS,
+    CAMERA_READ_TIMEOUT_SECONDS,
+    CAMERA_MAX_GRAB_FAILURES,
+    CAMERA_MJPEG_PASSTHROUGH,
+    CAMERA_RESOLUTION,
+)
+from eyesight.video.governor import (
+    DEFAULT_DECISION,
+    CaptureGovernor,
+    GovernorDecision,
+    queue_fill,
+)
+from eyesight.video.encoder import ImageEncoder
+from eyesight.video.pool import EncodePool
 from eyesight.video.processing import process_image
-from eyesight.video.config import CAPTURE_INTERVAL_SECONDS
+from eyesight.video.scheduler import CaptureScheduler
 
 logger = logging.getLogger(__name__)
 
+_JPEG_MAGIC = b"\xff\xd8"
 
-async def get_frame(cap) -> Optional[Dict[str, str]]:
-    """Capture a frame from the camera and process it.
+
+@dataclass
+class CameraStats:
+    """Grab and retrieve counters and timings for a CameraSource."""
+
+    grabs: int = 0
+    retrieves: int = 0
+    failed_grabs: int = 0
+    passed_through: int = 0
+    grab_seconds: float = 0.0
+    retrieve_seconds: float = 0.0
+
+    @property
+    def mean_grab_ms(self) -> float:
+        """Mean time spent waiting for the device to deliver a frame."""
+        return self.grab_seconds * 1000 / self.grabs if self.grabs else 0.0
+
+    @property
+    def mean_retrieve_ms(self) -> float:
+        """Mean time spent decoding a grabbed frame."""
+        if not self.retrieves:
+            return 0.0
+        return self.retrieve_seconds * 1000 / self.retrieves
+
+
+class CameraSource:
+    """Reads a camera on a dedicated thread so frames are never stale.
+
+    Capture devices buffer several frames internally, so a single read per
+    capture interval returns an old one. The reader thread keeps draining
+    the device with `grab()`, which is cheap, and only decodes with
+    `retrieve()` the frame grabbed right after a `read()` request, so the
+    consumer always gets the newest frame. Opening and configuring the
+    device also happens on that thread; `wait_ready` waits for it
+    separately from the per-frame timeout of `read`.
+
+    With `mjpeg` set, the device is asked for MJPEG and `retrieve()`
+    returns the compressed frame as a flat byte array instead of decoding
+    it, so frames that already fit can be forwarded as-is.
+
+    Any object with OpenCV's `VideoCapture` interface (`isOpened`, `grab`,
+    `retrieve`, `release`, `get`, `set`) can be supplied through
+    `capture_factory`, e.g. a fake that replays synthetic frames.
+    """
+
+    def __init__(
+        self,
+        device: int = CAMERA_DEVICE_INDEX,
+        capture_factory: Callable[[int], Any] = cv2.VideoCapture,
+        mjpeg: bool = CAMERA_MJPEG_PASSTHROUGH,
+        resolution: Optional[Tuple[int, int]] = CAMERA_RESOLUTION,
+    ):
+        """
+        Args:
+            device: Camera device index
+            capture_factory: Callable opening the device
+            mjpeg: Request MJPEG and keep frames compressed
+            resolution: Width and height to request, or None
+        """
+        self._device = device
+        self._capture_factory = capture_factory
+        self._mjpeg = mjpeg
+        self._resolution = resolution
+        self._request: Optional[concurrent.futures.Future] = None
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = CameraStats()
+
+    def start(self):
+        """Start the reader thread, which opens the device."""
+        self._thread = threading.Thread(
+            target=self._read_loop, name="eyesight-camera", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Ask the reader thread to release the device and exit."""
+        self._stopped.set()
+
+    @property
+    def stopped(self) -> bool:
+        """Whether the source has stopped and will deliver no more frames."""
+        return self._stopped.is_set() or (
+            self._thread is not None and not self._thread.is_alive()
+        )
+
+    async def wait_ready(
+        self, timeout: float = CAMERA_OPEN_TIMEOUT_SECONDS
+    ) -> bool:
+        """Wait for the reader thread to open and configure the device.
+
+        Returns:
+            Whether the camera is open; False if it failed to open, was
+            stopped or is still opening after `timeout`
+        """
+        if not await asyncio.to_thread(self._ready.wait, timeout):
+            logger.warning("Camera is still opening after %.1f s", timeout)
+            return False
+        return not self.stopped
+
+    async def read(
+        self, timeout: float = CAMERA_READ_TIMEOUT_SECONDS
+    ) -> Optional[np.ndarray]:
+        """Return the newest frame from the camera.
+
+        Returns:
+            A BGR frame, or None if the camera is closed or timed out;
+            `stopped` tells the two apart
+        """
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._lock:
+            if self._stopped.is_set():
+                return None
+            previous, self._request = self._request, future
+        if previous is not None:
+            previous.cancel()
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except TimeoutError:
+            logger.warning("Camera did not deliver a frame in %.1f s", timeout)
+            return None
+
+    def _read_loop(self):
+        cap = self._capture_factory(self._device)
+        failures = 0
+        try:
+            if not cap.isOpened():
+                logger.error("Could not open camera %d", self._device)
+                return
+            self._configure(cap)
+            self._ready.set()
+
+            while not self._stopped.is_set():
+                start = time.perf_counter()
+                if not cap.grab():
+                    failures += 1
+                    self.stats.failed_grabs += 1
+                    if failures >= CAMERA_MAX_GRAB_FAILURES:
+                        logger.error("Camera stopped delivering frames")
+                        break
+                    continue
+                failures = 0
+                grabbed = time.perf_counter()
+                self.stats.grabs += 1
+                self.stats.grab_seconds += grabbed - start
+
+                with self._lock:
+                    request, self._request = self._request, None
+                if request is None:
+                    continue
+                if not request.set_running_or_notify_cancel():
+                    continue
+
+                ok, frame = cap.retrieve()
+                self.stats.retrieves += 1
+                self.stats.retrieve_seconds += time.perf_counter() - grabbed
+                request.set_result(frame if ok else None)
+        finally:
+            self._stopped.set()
+            # Wake wait_ready if the device never opened
+            self._ready.set()
+            with self._lock:
+                request, self._request = self._request, None
+            if request is not None and request.set_running_or_notify_cancel():
+                request.set_result(None)
+            cap.release()
+
+    def _configure(self, cap):
+        if self._resolution is not None:
+            width, height = self._resolution
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        if not self._mjpeg:
+            return
+
+        mjpg = cv2.VideoWriter_fourcc(*"MJPG")
+        cap.set(cv2.CAP_PROP_FOURCC, mjpg)
+        if int(cap.get(cv2.CAP_PROP_FOURCC)) != mjpg or not cap.set(
+            cv2.CAP_PROP_CONVERT_RGB, 0
+        ):
+            logger.info("Camera cannot deliver raw MJPEG; decoding frames")
+            cap.set(cv2.CAP_PROP_CONVERT_RGB, 1)
+
+    def log_summary(self):
+        """Log the grab and retrieve statistics gathered so far."""
+        stats = self.stats
+        logger.info(
+            "Camera: %d grabs (mean %.1f ms), %d retrieves (mean %.1f ms), "
+            "%d failed grabs, %d frames passed through",
+            stats.grabs,
+            stats.mean_grab_ms,
+            stats.retrieves,
+            stats.mean_retrieve_ms,
+            stats.failed_grabs,
+            stats.passed_through,
+        )
+
+
+def process_frame(
+    frame: np.ndarray,
+    decision: GovernorDecision = DEFAULT_DECISION,
+    encoder: Optional[ImageEncoder] = None,
+    stats: Optional[CameraStats] = None,
+    timestamp: Optional[float] = None,
+) -> MediaMessage:
+    """Process a camera frame.
+
+    Compressed MJPEG frames that already fit the thumbnail size and the
+    encoder's byte budget are forwarded unchanged; larger ones are decoded
+    with JPEG draft scaling and re-encoded.
 
     Args:
-        cap: OpenCV VideoCapture object
+        frame: BGR frame, or a 1-D or 1xN array holding a JPEG
+        decision: Capture interval and encode settings to apply
+        encoder: Optional encoder choosing quality (and format) per frame
+        stats: Optional camera stats counting passed-through frames
+        timestamp: Monotonic capture time, defaults to now
 
     Returns:
-        Processed frame or None if capture failed
+        Processed frame
     """
-    ret, frame = cap.read()
-    if not ret:
-        return None
+    # Backends return the compressed buffer as a flat array or a 1xN Mat
+    if (
+        frame.dtype == np.uint8
+        and frame.size
+        and (frame.ndim == 1 or 1 in frame.shape[:2])
+        and frame.reshape(-1)[:2].tobytes() == _JPEG_MAGIC
+    ):
+        data = frame.reshape(-1).tobytes()
+        img = Image.open(io.BytesIO(data))
+        budget = encoder.budget(decision.interval) if encoder else None
+        width, height = decision.thumbnail_size
+        if (
+            img.width <= width
+            and img.height <= height
+            and (budget is None or len(data) <= budget)
+        ):
+            if stats is not None:
+                stats.passed_through += 1
+            return MediaMessage("image/jpeg", data, timestamp)
+    else:
+        # Convert BGR to RGB color space
+        img = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
 
-    # Convert BGR to RGB color space
-    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    img = Image.fromarray(frame_rgb)
-    return process_image(img)
+    return process_image(
+        img,
+        decision.thumbnail_size,
+        decision.quality,
+        encoder,
+        decision.interval,
+        timestamp,
+    )
 
 
-async def capture_frames(queue: asyncio.Queue) -> None:
+async def capture_frames(
+    queue: asyncio.Queue,
+    scheduler: Optional[CaptureScheduler] = None,
+    governor: Optional[CaptureGovernor] = None,
+    encoder: Optional[ImageEncoder] = None,
+    pool: Optional[EncodePool] = None,
+    source: Optional[CameraSource] = None,
+) -> None:
     """Continuously capture frames from camera and add to queue.
 
     Args:
         queue: Queue to add captured frames to
+        scheduler: Capture cadence; a default one is created if not provided
+        governor: Optional governor adapting cadence and encode settings
+        encoder: Optional encoder choosing quality (and format) per frame
+        pool: Executor for capture and encode work; a private one is
+            created and shut down with the task if not provided
+        source: Camera to read from; the default device if not provided
     """
-    cap = None
+    own_pool = pool is None
+    pool = pool or EncodePool()
+    scheduler = scheduler or CaptureScheduler(name="Camera capture")
+    source = source or CameraSource()
     try:
-        cap = await asyncio.to_thread(cv2.VideoCapture, 0)
+        source.start()
+        await source.wait_ready()
 
-        while True:
+        async for captured_at in scheduler.ticks():
             try:
-                frame = await asyncio.to_thread(get_frame, cap)
+                raw = await source.read()
+                if raw is None:
+                    # A slow frame skips this tick; only a stopped source
+                    # ends the capture
+                    if source.stopped:
+                        break
+                    continue
+
+                decision = governor.decision if governor else DEFAULT_DECISION
+                frame = await pool.run(
+                    process_frame,
+                    raw,
+                    decision,
+                    encoder,
+                    source.stats,
+                    captured_at,
+                )
                 if frame is None:
-                    break
+                    continue
+                if governor is not None:
+                    # Camera frames carry no change estimate, so only
+                    # backpressure steers the governor here.
+                    decision = governor.update(None, queue_fill(queue))
+                    scheduler.interval = decision.interval
 
-                await asyncio.sleep(CAPTURE_INTERVAL_SECONDS)
-                await queue.put(frame)
+                await scheduler.enqueue(queue, frame, captured_at)
             except RuntimeError as e:
                 # Check if this is the "cannot schedule new futures after shutdown" error
                 if "cannot schedule new futures after shutdown" in str(e):
@@ -68,6 +367,11 @@ async def capture_frames(queue: asyncio.Queue) -> None:
         logger.exception("Error in camera capture:")
         raise
     finally:
-        # Ensure camera is released even if an exception occurs
-        if cap is not None:
-            cap.release()
+        # The reader thread releases the camera once it sees the stop
+        source.stop()
+        source.log_summary()
+        if own_pool:
+            pool.shutdown()
+        scheduler.log_summary()
+        if encoder is not None:
+            encoder.log_summary()
@@ -0,0 +1,181 @@
+"""Change detection for captured screen frames.
+
+Frames are compared on a coarse luminance fingerprint sampled straight from
+the raw capture buffer, so unchanged frames can be dropped before any
+resize or encode work is done, and frames whose changes are local can be
+cropped to the dirty region.
+"""
+
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+import numpy as np
+
+from eyesight.video.config import (
+    CHANGE_SAMPLE_STEP,
+    CHANGE_PIXEL_DELTA,
+    CHANGE_THRESHOLD,
+    KEYFRAME_INTERVAL_SECONDS,
+    DIRTY_TILE_SIZE,
+    DIRTY_MAX_AREA,
+    FULL_FRAME_INTERVAL_SECONDS,
+)
+
+# Left, top, right and bottom pixel bounds of a region
+Region = Tuple[int, int, int, int]
+
+
+@dataclass
+class ChangeStats:
+    """Counters for frames sent versus skipped by a ChangeDetector."""
+
+    sent: int = 0
+    skipped: int = 0
+    keyframes: int = 0
+    crops: int = 0
+    area_sent: float = 0.0
+
+    @property
+    def skip_ratio(self) -> float:
+        """Fraction of inspected frames that were skipped."""
+        total = self.sent + self.skipped
+        return self.skipped / total if total else 0.0
+
+    @property
+    def mean_area(self) -> float:
+        """Mean fraction of the screen area covered by each sent frame."""
+        return self.area_sent / self.sent if self.sent else 0.0
+
+
+def luminance_fingerprint(
+    bgra: bytes, size: Tuple[int, int], step: int = CHANGE_SAMPLE_STEP
+) -> np.ndarray:
+    """Sample a raw BGRA buffer into a downsampled luminance grid.
+
+    Args:
+        bgra: Raw BGRA pixel buffer, as returned by mss
+        size: Width and height of the buffer in pixels
+        step: Sampling stride in pixels along both axes
+
+    Returns:
+        2-D uint8 array of approximate luma values
+    """
+    width, height = size
+    pixels = np.frombuffer(bgra, dtype=np.uint8).reshape(height, width, 4)
+    sampled = pixels[::step, ::step, :3].astype(np.uint16)
+    luma = (
+        29 * sampled[..., 0] + 150 * sampled[..., 1] + 77 * sampled[..., 2]
+    ) >> 8
+    return luma.astype(np.uint8)
+
+
+@dataclass
+class ChangeDetector:
+    """Decides whether a captured frame differs enough to be sent.
+
+    The reference fingerprint is that of the last frame that was sent, so
+    slow drifts still accumulate into a change. A keyframe is forced once
+    `keyframe_interval` seconds have passed without sending anything.
+
+    When the changed samples fit in a small tile-aligned box, `region` is
+    set to that box so only the crop needs to be encoded; a full frame is
+    still sent every `full_frame_interval` seconds to keep the context.
+    """
+
+    threshold: float = CHANGE_THRESHOLD
+    pixel_delta: int = CHANGE_PIXEL_DELTA
+    sample_step: int = CHANGE_SAMPLE_STEP
+    keyframe_interval: float = KEYFRAME_INTERVAL_SECONDS
+    tile_size: int = DIRTY_TILE_SIZE
+    max_region_area: float = DIRTY_MAX_AREA
+    full_frame_interval: float = FULL_FRAME_INTERVAL_SECONDS
+    stats: ChangeStats = field(default_factory=ChangeStats)
+    last_change: float = field(default=0.0, init=False)
+    region: Optional[Region] = field(default=None, init=False)
+    _reference: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False
+    )
+    _last_sent: float = field(default=-math.inf, init=False, repr=False)
+    _last_full: float = field(default=-math.inf, init=False, repr=False)
+
+    def changed_mask(self, fingerprint: np.ndarray) -> Optional[np.ndarray]:
+        """Return which samples differ from the reference, if there is one."""
+        reference = self._reference
+        if reference is None or reference.shape != fingerprint.shape:
+            return None
+        delta = np.abs(np.subtract(fingerprint, reference, dtype=np.int16))
+        return delta > self.pixel_delta
+
+    def dirty_region(
+        self, mask: np.ndarray, size: Tuple[int, int]
+    ) -> Optional[Region]:
+        """Return the tile-aligned box around the changed samples.
+
+        Returns:
+            The region, or None if nothing changed or the box is too large
+            to be worth cropping
+        """
+        rows = np.flatnonzero(mask.any(axis=1))
+        cols = np.flatnonzero(mask.any(axis=0))
+        if not rows.size:
+            return None
+
+        width, height = size
+        step, tile = self.sample_step, self.tile_size
+        left = cols[0] * step // tile * tile
+        top = rows[0] * step // tile * tile
+        right = min(width, -(-(cols[-1] + 1) * step // tile) * tile)
+        bottom = min(height, -(-(rows[-1] + 1) * step // tile) * tile)
+        area = (right - left) * (bottom - top)
+        if area > self.max_region_area * width * height:
+            return None
+        return int(left), int(top), int(right), int(bottom)
+
+    def check(
+        self,
+        bgra: bytes,
+        size: Tuple[int, int],
+        now: Optional[float] = None,
+    ) -> bool:
+        """Fingerprint a raw frame and decide whether it should be sent.
+
+        Args:
+            bgra: Raw BGRA pixel buffer
+            size: Width and height of the buffer in pixels
+            now: Monotonic timestamp of the capture, defaults to now
+
+        Returns:
+            True if the frame changed or a keyframe is due; `region` then
+            holds the crop to send, or None for the full frame
+        """
+        now = time.monotonic() if now is None else now
+        fingerprint = luminance_fingerprint(bgra, size, self.sample_step)
+        mask = self.changed_mask(fingerprint)
+        self.last_change = 1.0 if mask is None else mask.mean()
+
+        changed = self.last_change > self.threshold
+        if not changed and now - self._last_sent < self.keyframe_interval:
+            self.stats.skipped += 1
+            return False
+
+        self.region = None
+        if changed and mask is not None:
+            if now - self._last_full < self.full_frame_interval:
+                self.region = self.dirty_region(mask, size)
+        if self.region is None:
+            self._last_full = now
+            self.stats.area_sent += 1.0
+        else:
+            left, top, right, bottom = self.region
+            self.stats.crops += 1
+            self.stats.area_sent += (
+                (right - left) * (bottom - top) / (size[0] * size[1])
+            )
+
+        self.stats.keyframes += not changed
+        self._reference = fingerprint
+        self._last_sent = now
+        self.stats.sent += 1
+        return True
@@ -0,0 +1,209 @@
+"""Content-aware codec selection for screen frames.
+
+Flat UI and text compress poorly as JPEG and come out smeared, while
+camera-like content is what JPEG is good at. Each frame is classified on
+a small nearest-neighbour sample and encoded with the candidate formats
+that suit its class; the smallest payload within budget is sent.
+"""
+
+import logging
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+import numpy as np
+import PIL.Image
+
+from eyesight.video.config import (
+    CAPTURE_INTERVAL_SECONDS,
+    CODEC_SAMPLE_WIDTH,
+    CODEC_FLAT_MAX_COLORS,
+    CODEC_TEXT_EDGE_DENSITY,
+    CODEC_WEBP_METHOD,
+    CODEC_PNG_COMPRESS_LEVEL,
+)
+from eyesight.video.encoder import (
+    SUBSAMPLING_420,
+    SUBSAMPLING_444,
+    BudgetEncoder,
+    EncodeResult,
+)
+from eyesight.video.processing import encode_image
+
+logger = logging.getLogger(__name__)
+
+# Content classes returned by CodecSelector.classify
+FLAT = "flat"
+TEXT = "text"
+PHOTO = "photo"
+
+# Luma step between neighbouring samples that counts as an edge
+_EDGE_STEP = 32
+
+
+@dataclass
+class FormatStats:
+    """Size and encode-time totals for one output format."""
+
+    encoded: int = 0
+    chosen: int = 0
+    total_bytes: int = 0
+    total_seconds: float = 0.0
+
+    @property
+    def mean_bytes(self) -> float:
+        """Mean payload size of the frames encoded in this format."""
+        return self.total_bytes / self.encoded if self.encoded else 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        """Mean encode time in milliseconds."""
+        if not self.encoded:
+            return 0.0
+        return self.total_seconds * 1000 / self.encoded
+
+
+@dataclass
+class CodecSelector:
+    """Picks JPEG, WebP or palettised PNG per frame.
+
+    Flat frames are tried as palettised PNG and lossless WebP, falling
+    back to JPEG when neither fits the budget, text-heavy frames as lossy
+    WebP and JPEG, and everything else as JPEG only. JPEG goes through the
+    wrapped BudgetEncoder, whose chosen quality is reused for lossy WebP
+    so both candidates aim at similar fidelity.
+    """
+
+    encoder: BudgetEncoder = field(default_factory=BudgetEncoder)
+    sample_width: int = CODEC_SAMPLE_WIDTH
+    flat_max_colors: int = CODEC_FLAT_MAX_COLORS
+    text_edge_density: float = CODEC_TEXT_EDGE_DENSITY
+    stats: Dict[str, FormatStats] = field(
+        default_factory=lambda: defaultdict(FormatStats)
+    )
+    classes: Counter = field(default_factory=Counter)
+
+    def classify(self, img: PIL.Image.Image) -> str:
+        """Classify a frame as FLAT, TEXT or PHOTO from a small sample."""
+        width, height = img.size
+        scale = min(1.0, self.sample_width / width)
+        sample = img.resize(
+            (max(1, round(width * scale)), max(1, round(height * scale))),
+            PIL.Image.Resampling.NEAREST,
+        )
+        if sample.getcolors(self.flat_max_colors) is not None:
+            return FLAT
+
+        luma = np.asarray(sample.convert("L"), dtype=np.int16)
+        edges = (np.abs(np.diff(luma, axis=0))[:, :-1] > _EDGE_STEP) | (
+            np.abs(np.diff(luma, axis=1))[:-1, :] > _EDGE_STEP
+        )
+        return TEXT if edges.mean() >= self.text_edge_density else PHOTO
+
+    def encode(
+        self,
+        img: PIL.Image.Image,
+        max_quality: Optional[int] = None,
+        interval: float = CAPTURE_INTERVAL_SECONDS,
+    ) -> EncodeResult:
+        """Encode a frame in whichever suitable format is smallest.
+
+        Args:
+            img: The image to encode, already resized
+            max_quality: Upper bound for lossy quality
+            interval: Seconds until the next frame, for the rate budget
+
+        Returns:
+            The chosen encoding
+        """
+        kind = self.classify(img)
+        self.classes[kind] += 1
+        budget = self.budget(interval)
+
+        def _fits(result: EncodeResult) -> bool:
+            return budget is None or len(result.data) <= budget
+
+        if kind == FLAT:
+            results = [
+                self._timed(lambda: self._palette_png(img)),
+                self._timed(lambda: self._webp(img, 100, lossless=True)),
+            ]
+            if not any(_fits(result) for result in results):
+                # Lossless formats cannot shrink to a budget; the budgeted
+                # JPEG can
+                results.append(
+                    self._timed(
+                        lambda: self.encoder.encode(img, max_quality, interval)
+                    )
+                )
+        else:
+            jpeg = self._timed(
+                lambda: self.encoder.encode(img, max_quality, interval)
+            )
+            results = [jpeg]
+            if kind == TEXT:
+                results.append(
+                    self._timed(lambda: self._webp(img, jpeg.quality))
+                )
+
+        fitting = [result for result in results if _fits(result)]
+        best = min(fitting or results, key=lambda result: len(result.data))
+        self.stats[best.mime_type].chosen += 1
+        logger.debug(
+            "Codec: %s frame sent as %s, %d bytes",
+            kind,
+            best.mime_type,
+            len(best.data),
+        )
+        return best
+
+    def budget(
+        self, interval: float = CAPTURE_INTERVAL_SECONDS
+    ) -> Optional[int]:
+        """Return the byte budget of the wrapped encoder."""
+        return self.encoder.budget(interval)
+
+    def log_summary(self):
+        """Log per-format size and encode-time statistics."""
+        logger.info("Codec classes: %s", dict(self.classes))
+        for mime_type, stats in self.stats.items():
+            logger.info(
+                "Codec %s: chosen %d/%d, mean %.0f bytes, mean %.1f ms",
+                mime_type,
+                stats.chosen,
+                stats.encoded,
+                stats.mean_bytes,
+                stats.mean_ms,
+            )
+
+    def _timed(self, candidate: Callable[[], EncodeResult]) -> EncodeResult:
+        start = time.perf_counter()
+        result = candidate()
+        stats = self.stats[result.mime_type]
+        stats.encoded += 1
+        stats.total_bytes += len(result.data)
+        stats.total_seconds += time.perf_counter() - start
+        return result
+
+    @staticmethod
+    def _palette_png(img: PIL.Image.Image) -> EncodeResult:
+        palettised = img.quantize(256, method=PIL.Image.Quantize.FASTOCTREE)
+        data = encode_image(
+            palettised, "png", compress_level=CODEC_PNG_COMPRESS_LEVEL
+        )
+        return EncodeResult(data, 100, SUBSAMPLING_444, 1, "image/png")
+
+    @staticmethod
+    def _webp(
+        img: PIL.Image.Image, quality: int, lossless: bool = False
+    ) -> EncodeResult:
+        data = encode_image(
+            img,
+            "webp",
+            quality=quality,
+            lossless=lossless,
+            method=CODEC_WEBP_METHOD,
+        )
+        subsampling = SUBSAMPLING_444 if lossless else SUBSAMPLING_420
+        return EncodeResult(data, quality, subsampling, 1, "image/webp")
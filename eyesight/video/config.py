@@ -8,8 +8,107 @@ CAPTURE_INTERVAL_SECONDS: float = 1.0
 # Thumbnail size for processing images before sending to Gemini
 PROCESSING_THUMBNAIL_SIZE: typing.Tuple[int, int] = (1024, 1024)
 
+# JPEG quality used when no governor or encoder overrides it
+PROCESSING_JPEG_QUALITY: int = 75
+
 # Image format for processing
 PROCESSING_IMAGE_FORMAT: str = "jpeg"
 
 # MIME type corresponding to the image format
 PROCESSING_MIME_TYPE: str = "image/jpeg"
+
+# Pixel stride used to sample the raw screen buffer for change detection
+CHANGE_SAMPLE_STEP: int = 8
+
+# Luminance delta (0-255) above which a sampled pixel counts as changed
+CHANGE_PIXEL_DELTA: int = 8
+
+# Fraction of changed samples above which a frame is considered new
+CHANGE_THRESHOLD: float = 0.0
+
+# Force a frame out at least this often, even if nothing has changed
+KEYFRAME_INTERVAL_SECONDS: float = 10.0
+
+# Bounds for the adaptive capture governor
+GOVERNOR_MIN_INTERVAL_SECONDS: float = 0.25
+GOVERNOR_MAX_INTERVAL_SECONDS: float = 4.0
+GOVERNOR_MIN_THUMBNAIL_SIZE: typing.Tuple[int, int] = (384, 384)
+GOVERNOR_MAX_THUMBNAIL_SIZE: typing.Tuple[int, int] = PROCESSING_THUMBNAIL_SIZE
+GOVERNOR_MIN_JPEG_QUALITY: int = 40
+GOVERNOR_MAX_JPEG_QUALITY: int = PROCESSING_JPEG_QUALITY
+
+# Changed-sample fraction above which content counts as fast-moving
+GOVERNOR_FAST_CHANGE: float = 0.05
+
+# Uplink queue fill ratio at which the governor backs off
+GOVERNOR_PRESSURE_FILL: float = 0.8
+
+# Consecutive pressured (or calm) frames before stepping quality/resolution
+GOVERNOR_STEP_FRAMES: int = 3
+
+# Byte budget per encoded frame, or None to disable the limit
+ENCODER_FRAME_BUDGET_BYTES: typing.Optional[int] = 120_000
+
+# Upstream byte budget per second, spread over the capture interval,
+# or None to disable the limit
+ENCODER_RATE_BUDGET_BYTES: typing.Optional[int] = None
+
+# Lowest quality the budget encoder will search down to
+ENCODER_MIN_QUALITY: int = 20
+
+# Maximum number of encode attempts per frame during the quality search
+ENCODER_MAX_ATTEMPTS: int = 5
+
+# Width of the nearest-neighbour sample used to classify screen content
+CODEC_SAMPLE_WIDTH: int = 256
+
+# Sampled frames with at most this many colours count as flat UI
+CODEC_FLAT_MAX_COLORS: int = 256
+
+# Fraction of sampled pixels on an edge above which a frame counts as text
+CODEC_TEXT_EDGE_DENSITY: float = 0.08
+
+# Encoder effort for WebP (0 fastest - 6 smallest) and PNG (0-9)
+CODEC_WEBP_METHOD: int = 2
+CODEC_PNG_COMPRESS_LEVEL: int = 3
+
+# Tile size in pixels that dirty regions are snapped to
+DIRTY_TILE_SIZE: int = 64
+
+# Largest dirty region, as a fraction of the screen, that is sent as a crop
+DIRTY_MAX_AREA: float = 0.25
+
+# Send a full frame at least this often while only crops would be sent
+FULL_FRAME_INTERVAL_SECONDS: float = 5.0
+
+# Threads dedicated to video capture and encoding
+VIDEO_POOL_WORKERS: int = 1
+
+# Video jobs allowed to run at once; further jobs wait for a slot
+VIDEO_POOL_MAX_IN_FLIGHT: int = 1
+
+# Index of the camera device opened by the camera source
+CAMERA_DEVICE_INDEX: int = 0
+
+# How long to wait for the camera to open and be configured; opening can
+# take several seconds on some backends
+CAMERA_OPEN_TIMEOUT_SECONDS: float = 10.0
+
+# How long to wait for the camera reader thread to deliver a frame once
+# the camera is open
+CAMERA_READ_TIMEOUT_SECONDS: float = 2.0
+
+# Consecutive failed grabs after which the camera is considered lost
+CAMERA_MAX_GRAB_FAILURES: int = 10
+
+# Ask the camera for MJPEG and forward its frames without re-encoding
+# when they already fit the size and byte limits
+CAMERA_MJPEG_PASSTHROUGH: bool = False
+
+# Resolution requested from the camera, or None for the device default.
+# With MJPEG passthrough, a mode within the thumbnail size such as
+# (1024, 576) lets frames be forwarded without re-encoding.
+CAMERA_RESOLUTION: typing.Optional[typing.Tuple[int, int]] = None
+
+# How often a window capture target's geometry is looked up again
+WINDOW_REFRESH_SECONDS: float = 2.0
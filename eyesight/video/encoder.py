@@ -0,0 +1,191 @@
+"""Byte-budgeted image encoding for the Eyesight video pipeline."""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Optional, Protocol
+
+import PIL.Image
+
+from eyesight.video.config import (
+    CAPTURE_INTERVAL_SECONDS,
+    PROCESSING_JPEG_QUALITY,
+    ENCODER_FRAME_BUDGET_BYTES,
+    ENCODER_RATE_BUDGET_BYTES,
+    ENCODER_MIN_QUALITY,
+    ENCODER_MAX_ATTEMPTS,
+)
+from eyesight.video.processing import encode_image
+
+logger = logging.getLogger(__name__)
+
+# PIL JPEG subsampling modes
+SUBSAMPLING_444 = 0
+SUBSAMPLING_420 = 2
+
+
+@dataclass(frozen=True)
+class EncodeResult:
+    """An encoded frame and the settings that produced it."""
+
+    data: bytes
+    quality: int
+    subsampling: int
+    attempts: int
+    mime_type: str = "image/jpeg"
+
+
+@dataclass
+class EncoderStats:
+    """Running totals for the frames produced by a BudgetEncoder."""
+
+    frames: int = 0
+    total_bytes: int = 0
+    over_budget: int = 0
+    last_bytes: int = 0
+    last_quality: int = 0
+
+    @property
+    def mean_bytes(self) -> float:
+        """Mean encoded frame size in bytes."""
+        return self.total_bytes / self.frames if self.frames else 0.0
+
+    def record(self, result: EncodeResult, budget: Optional[int]):
+        """Record one encoded frame against the budget it was given."""
+        self.frames += 1
+        self.total_bytes += len(result.data)
+        self.over_budget += budget is not None and len(result.data) > budget
+        self.last_bytes = len(result.data)
+        self.last_quality = result.quality
+
+
+class ImageEncoder(Protocol):
+    """Anything that can encode a resized frame for the uplink."""
+
+    def encode(
+        self,
+        img: PIL.Image.Image,
+        max_quality: Optional[int] = None,
+        interval: float = CAPTURE_INTERVAL_SECONDS,
+    ) -> EncodeResult: ...
+
+    def budget(
+        self, interval: float = CAPTURE_INTERVAL_SECONDS
+    ) -> Optional[int]: ...
+
+    def log_summary(self): ...
+
+
+@dataclass
+class BudgetEncoder:
+    """JPEG encoder that searches for the highest quality fitting a budget.
+
+    The budget is the tighter of a fixed per-frame limit and a per-second
+    limit spread over the capture interval. The search is a bisection over
+    quality that starts from the quality chosen for the previous frame, so
+    steady content usually needs a single encode. When even the top
+    quality fits comfortably, 4:4:4 chroma is tried to keep coloured text
+    sharp.
+    """
+
+    frame_budget: Optional[int] = ENCODER_FRAME_BUDGET_BYTES
+    rate_budget: Optional[int] = ENCODER_RATE_BUDGET_BYTES
+    min_quality: int = ENCODER_MIN_QUALITY
+    max_quality: int = PROCESSING_JPEG_QUALITY
+    max_attempts: int = ENCODER_MAX_ATTEMPTS
+    chroma_search: bool = True
+    stats: EncoderStats = field(default_factory=EncoderStats)
+    _quality: Optional[int] = field(default=None, init=False, repr=False)
+
+    def budget(
+        self, interval: float = CAPTURE_INTERVAL_SECONDS
+    ) -> Optional[int]:
+        """Return the byte budget for one frame sent every `interval` s."""
+        limits = [
+            limit
+            for limit in (
+                self.frame_budget,
+                self.rate_budget and int(self.rate_budget * interval),
+            )
+            if limit
+        ]
+        return min(limits) if limits else None
+
+    def encode(
+        self,
+        img: PIL.Image.Image,
+        max_quality: Optional[int] = None,
+        interval: float = CAPTURE_INTERVAL_SECONDS,
+    ) -> EncodeResult:
+        """Encode an image within the byte budget.
+
+        Args:
+            img: The image to encode, already resized
+            max_quality: Upper bound for the search, e.g. from the governor
+            interval: Seconds until the next frame, for the rate budget
+
+        Returns:
+            The encoded frame; if nothing fits, the smallest attempt
+        """
+        budget = self.budget(interval)
+        top = min(max_quality or self.max_quality, self.max_quality)
+        lo, hi = min(self.min_quality, top), top
+        if budget is None:
+            result = self._encode(img, hi, SUBSAMPLING_420, 1)
+            self.stats.record(result, budget)
+            return result
+
+        quality = min(max(self._quality or hi, lo), hi)
+        fitting: Optional[EncodeResult] = None
+        smallest: Optional[EncodeResult] = None
+        attempts = 0
+        while lo <= hi and attempts < self.max_attempts:
+            attempts += 1
+            result = self._encode(img, quality, SUBSAMPLING_420, attempts)
+            if len(result.data) <= budget:
+                fitting, lo = result, quality + 1
+            else:
+                smallest, hi = result, quality - 1
+            quality = (lo + hi) // 2
+
+        result = fitting or smallest
+        if (
+            self.chroma_search
+            and fitting is not None
+            and fitting.quality == top
+            and attempts < self.max_attempts
+        ):
+            full = self._encode(
+                img, fitting.quality, SUBSAMPLING_444, attempts + 1
+            )
+            if len(full.data) <= budget:
+                result = full
+
+        self._quality = result.quality
+        self.stats.record(result, budget)
+        logger.debug(
+            "Encoded frame: %d bytes (budget %d) at quality %d, %d attempt(s)",
+            len(result.data),
+            budget,
+            result.quality,
+            result.attempts,
+        )
+        return result
+
+    def log_summary(self):
+        """Log the encoded size statistics gathered so far."""
+        stats = self.stats
+        logger.info(
+            "Encoder: %d frames, mean %.0f bytes, %d over budget",
+            stats.frames,
+            stats.mean_bytes,
+            stats.over_budget,
+        )
+
+    @staticmethod
+    def _encode(
+        img: PIL.Image.Image, quality: int, subsampling: int, attempts: int
+    ) -> EncodeResult:
+        data = encode_image(
+            img, "jpeg", quality=quality, subsampling=subsampling
+        )
+        return EncodeResult(data, quality, subsampling, attempts)
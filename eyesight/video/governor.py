@@ -0,0 +1,128 @@
+"""Adaptive frame-rate, resolution and quality control for video capture."""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+from eyesight.video.config import (
+    CAPTURE_INTERVAL_SECONDS,
+    PROCESSING_THUMBNAIL_SIZE,
+    PROCESSING_JPEG_QUALITY,
+    GOVERNOR_MIN_INTERVAL_SECONDS,
+    GOVERNOR_MAX_INTERVAL_SECONDS,
+    GOVERNOR_MIN_THUMBNAIL_SIZE,
+    GOVERNOR_MAX_THUMBNAIL_SIZE,
+    GOVERNOR_MIN_JPEG_QUALITY,
+    GOVERNOR_MAX_JPEG_QUALITY,
+    GOVERNOR_FAST_CHANGE,
+    GOVERNOR_PRESSURE_FILL,
+    GOVERNOR_STEP_FRAMES,
+)
+
+logger = logging.getLogger(__name__)
+
+# Multiplicative steps used when moving between bounds
+_INTERVAL_STEP = 1.5
+_SCALE_STEP = 0.75
+_QUALITY_STEP = 10
+
+
+@dataclass(frozen=True)
+class GovernorDecision:
+    """Capture settings currently chosen by a CaptureGovernor."""
+
+    interval: float
+    thumbnail_size: Tuple[int, int]
+    quality: int
+
+
+# Settings used when capture runs without a governor
+DEFAULT_DECISION = GovernorDecision(
+    CAPTURE_INTERVAL_SECONDS, PROCESSING_THUMBNAIL_SIZE, PROCESSING_JPEG_QUALITY
+)
+
+
+def queue_fill(queue: asyncio.Queue) -> float:
+    """Return how full a bounded queue is, from 0.0 to 1.0."""
+    return queue.qsize() / queue.maxsize if queue.maxsize > 0 else 0.0
+
+
+@dataclass
+class CaptureGovernor:
+    """Adapts capture cadence and encode settings to content and backpressure.
+
+    The interval shrinks while content changes fast, relaxes back to the
+    base interval on moderate change and grows while content is static or
+    the uplink queue is nearly full. Under sustained pressure JPEG quality
+    is stepped down first, then resolution; both are restored in the
+    reverse order once the pressure has cleared for as long.
+    """
+
+    base_interval: float = CAPTURE_INTERVAL_SECONDS
+    min_interval: float = GOVERNOR_MIN_INTERVAL_SECONDS
+    max_interval: float = GOVERNOR_MAX_INTERVAL_SECONDS
+    min_size: Tuple[int, int] = GOVERNOR_MIN_THUMBNAIL_SIZE
+    max_size: Tuple[int, int] = GOVERNOR_MAX_THUMBNAIL_SIZE
+    min_quality: int = GOVERNOR_MIN_JPEG_QUALITY
+    max_quality: int = GOVERNOR_MAX_JPEG_QUALITY
+    fast_change: float = GOVERNOR_FAST_CHANGE
+    pressure_fill: float = GOVERNOR_PRESSURE_FILL
+    step_frames: int = GOVERNOR_STEP_FRAMES
+    decision: GovernorDecision = field(init=False)
+    _scale: float = field(default=1.0, init=False, repr=False)
+    _pressured: int = field(default=0, init=False, repr=False)
+    _calm: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self):
+        self.decision = GovernorDecision(
+            self.base_interval, self.max_size, self.max_quality
+        )
+
+    @property
+    def _min_scale(self) -> float:
+        return min(lo / hi for lo, hi in zip(self.min_size, self.max_size))
+
+    def update(self, change: Optional[float], fill: float) -> GovernorDecision:
+        """Fold one capture observation into the current decision.
+
+        Args:
+            change: Fraction of the frame that changed, or None if unknown
+            fill: Uplink queue fill ratio, see `queue_fill`
+
+        Returns:
+            The updated decision
+        """
+        pressured = fill >= self.pressure_fill
+        self._pressured = self._pressured + 1 if pressured else 0
+        self._calm = 0 if pressured else self._calm + 1
+
+        interval = self.decision.interval
+        if pressured or change == 0.0:
+            interval *= _INTERVAL_STEP
+        elif change is not None and change >= self.fast_change:
+            interval /= _INTERVAL_STEP
+        else:
+            interval = self.base_interval
+        interval = min(max(interval, self.min_interval), self.max_interval)
+
+        quality = self.decision.quality
+        if self._pressured >= self.step_frames:
+            self._pressured = 0
+            if quality > self.min_quality:
+                quality = max(quality - _QUALITY_STEP, self.min_quality)
+            else:
+                self._scale = max(self._scale * _SCALE_STEP, self._min_scale)
+        elif self._calm >= self.step_frames:
+            self._calm = 0
+            if self._scale < 1.0:
+                self._scale = min(self._scale / _SCALE_STEP, 1.0)
+            else:
+                quality = min(quality + _QUALITY_STEP, self.max_quality)
+
+        size = tuple(round(side * self._scale) for side in self.max_size)
+        decision = GovernorDecision(interval, size, quality)
+        if decision != self.decision:
+            logger.debug("Capture governor: %s", decision)
+        self.decision = decision
+        return decision
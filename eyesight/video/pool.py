@@ -0,0 +1,95 @@
+"""Dedicated executor for video capture and encode work.
+
+Video jobs used to share the default executor with every audio chunk hop
+and the blocking console input. Running them on their own bounded pool
+keeps a slow 4K encode from delaying audio. Pillow and NumPy release the
+GIL for the heavy resize, encode and compare steps, so threads suffice
+and the stateful grabbers and detectors need no pickling.
+"""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, TypeVar
+
+from eyesight.video.config import (
+    VIDEO_POOL_WORKERS,
+    VIDEO_POOL_MAX_IN_FLIGHT,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class PoolStats:
+    """Counters for the jobs handled by an EncodePool."""
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+
+
+class EncodePool:
+    """Runs video jobs on a dedicated executor with an in-flight limit.
+
+    At most `max_in_flight` jobs run at once; further jobs wait for a slot
+    in order. Each capture loop awaits its job before taking the next
+    frame, so frames do not pile up here; a frame that goes stale while
+    waiting to be sent is replaced in the uplink's latest-wins video slot.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = VIDEO_POOL_WORKERS,
+        max_in_flight: int = VIDEO_POOL_MAX_IN_FLIGHT,
+    ):
+        """
+        Args:
+            max_workers: Number of worker threads
+            max_in_flight: Number of jobs allowed to run at once
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="eyesight-video"
+        )
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self.stats = PoolStats()
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run `fn(*args)` on the pool.
+
+        Returns:
+            The job's result
+        """
+        self.stats.submitted += 1
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            try:
+                result = await loop.run_in_executor(
+                    self._executor, functools.partial(fn, *args)
+                )
+            except asyncio.CancelledError:
+                self.stats.cancelled += 1
+                raise
+            except Exception:
+                self.stats.failed += 1
+                raise
+            self.stats.completed += 1
+            return result
+
+    def shutdown(self):
+        """Stop accepting jobs and cancel the ones not yet started."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        stats = self.stats
+        logger.info(
+            "Video pool: %d jobs submitted, %d completed, %d failed, "
+            "%d cancelled",
+            stats.submitted,
+            stats.completed,
+            stats.failed,
+            stats.cancelled,
+        )
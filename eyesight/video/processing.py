@@ -1,35 +1,69 @@
 """Image processing utilities for the Eyesight application."""
 
 import io
-import base64
-from typing import Dict
+from typing import TYPE_CHECKING, Optional, Tuple
 
 import PIL.Image
 
+from eyesight.core.media import MediaMessage
 from eyesight.video.config import (
+    CAPTURE_INTERVAL_SECONDS,
     PROCESSING_THUMBNAIL_SIZE,
+    PROCESSING_JPEG_QUALITY,
     PROCESSING_IMAGE_FORMAT,
     PROCESSING_MIME_TYPE,
 )
 
+if TYPE_CHECKING:
+    from eyesight.video.encoder import ImageEncoder
 
-def process_image(img: PIL.Image.Image) -> Dict[str, str]:
+
+def encode_image(
+    img: PIL.Image.Image, image_format: str = PROCESSING_IMAGE_FORMAT, **params
+) -> bytes:
+    """Encode an image to bytes in the given format.
+
+    Args:
+        img: The PIL Image to encode
+        image_format: PIL format name
+        **params: Encoder options passed to `PIL.Image.Image.save`
+
+    Returns:
+        The encoded image bytes
+    """
+    with io.BytesIO() as image_io:
+        img.save(image_io, format=image_format, **params)
+        return image_io.getvalue()
+
+
+def process_image(
+    img: PIL.Image.Image,
+    thumbnail_size: Tuple[int, int] = PROCESSING_THUMBNAIL_SIZE,
+    quality: int = PROCESSING_JPEG_QUALITY,
+    encoder: Optional["ImageEncoder"] = None,
+    interval: float = CAPTURE_INTERVAL_SECONDS,
+    timestamp: Optional[float] = None,
+) -> MediaMessage:
     """Process an image and return it in the format expected by Gemini API.
 
     Args:
         img: The PIL Image to process
+        thumbnail_size: Bounding box the image is downscaled to fit
+        quality: Encoder quality (1-95); the upper bound if `encoder` is set
+        encoder: Optional encoder choosing the quality (and format) to use
+        interval: Seconds until the next frame, for per-second budgets
+        timestamp: Monotonic capture time, defaults to now
 
     Returns:
-        Dictionary with mime_type and base64-encoded image data
+        The encoded image as a media message
     """
-    img.thumbnail(PROCESSING_THUMBNAIL_SIZE)
+    img.thumbnail(thumbnail_size)
 
-    with io.BytesIO() as image_io:
-        img.save(image_io, format=PROCESSING_IMAGE_FORMAT)
-        image_io.seek(0)
-        image_bytes = image_io.read()
-
-    return {
-        "mime_type": PROCESSING_MIME_TYPE,
-        "data": base64.b64encode(image_bytes).decode(),
-    }
+    mime_type = PROCESSING_MIME_TYPE
+    if encoder is not None:
+        result = encoder.encode(img, quality, interval)
+        image_bytes, mime_type = result.data, result.mime_type
+    else:
+        image_bytes = encode_image(img, quality=quality)
+
+    return MediaMessage(mime_type, image_bytes, timestamp)
@@ -0,0 +1,92 @@
+"""Deadline-driven capture scheduling for the Eyesight video sources."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator
+
+from eyesight.video.config import CAPTURE_INTERVAL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FrameAgeStats:
+    """Capture-to-enqueue age of the frames sent by a CaptureScheduler."""
+
+    frames: int = 0
+    missed_ticks: int = 0
+    last_ms: float = 0.0
+    max_ms: float = 0.0
+    total_ms: float = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        """Mean capture-to-enqueue age in milliseconds."""
+        return self.total_ms / self.frames if self.frames else 0.0
+
+    def record(self, age_ms: float):
+        """Record the age of one enqueued frame."""
+        self.frames += 1
+        self.last_ms = age_ms
+        self.max_ms = max(self.max_ms, age_ms)
+        self.total_ms += age_ms
+
+
+@dataclass
+class CaptureScheduler:
+    """Fires captures on a fixed monotonic cadence.
+
+    Deadlines advance by `interval` from the first tick rather than from
+    the end of the previous capture, so capture and encode time do not add
+    drift. Ticks that are overrun are skipped instead of bunching up.
+    Frames are meant to be enqueued as soon as they are encoded.
+    """
+
+    interval: float = CAPTURE_INTERVAL_SECONDS
+    name: str = "capture"
+    stats: FrameAgeStats = field(default_factory=FrameAgeStats)
+
+    async def ticks(self) -> AsyncIterator[float]:
+        """Yield the monotonic start time of each capture slot."""
+        deadline = time.monotonic()
+        while True:
+            yield time.monotonic()
+
+            deadline += self.interval
+            now = time.monotonic()
+            if deadline < now:
+                missed = int((now - deadline) // self.interval) + 1
+                self.stats.missed_ticks += missed
+                deadline += missed * self.interval
+            await asyncio.sleep(deadline - now)
+
+    async def enqueue(
+        self, queue: asyncio.Queue, frame: Any, captured_at: float
+    ):
+        """Put a frame on the queue and record how old it was on arrival.
+
+        Args:
+            queue: Queue to add the frame to
+            frame: The processed frame
+            captured_at: Monotonic timestamp yielded by `ticks`
+        """
+        await queue.put(frame)
+        age_ms = (time.monotonic() - captured_at) * 1000
+        self.stats.record(age_ms)
+        logger.debug(
+            "%s frame enqueued %.1f ms after capture", self.name, age_ms
+        )
+
+    def log_summary(self):
+        """Log the frame age statistics gathered so far."""
+        stats = self.stats
+        logger.info(
+            "%s: %d frames, age mean %.1f ms / max %.1f ms, %d missed ticks",
+            self.name,
+            stats.frames,
+            stats.mean_ms,
+            stats.max_ms,
+            stats.missed_ticks,
+        )
@@ -1,63 +1,314 @@
 """Screen capture functionality for the Eyesight application."""
 
-import io
 import asyncio
 import logging
+import math
+import subprocess
+import sys
+import time
 from typing import Dict, Optional
 
 import mss
+import mss.base
+import mss.screenshot
 import PIL.Image
-import mss.tools
 
+from eyesight.config import (
+    CaptureTarget,
+    CaptureTargetKind,
+    DEFAULT_CAPTURE_TARGET,
+)
+from eyesight.core.media import MediaMessage
+from eyesight.video.change import ChangeDetector, Region
+from eyesight.video.config import WINDOW_REFRESH_SECONDS
+from eyesight.video.governor import (
+    DEFAULT_DECISION,
+    CaptureGovernor,
+    GovernorDecision,
+    queue_fill,
+)
+from eyesight.video.encoder import ImageEncoder
+from eyesight.video.pool import EncodePool
 from eyesight.video.processing import process_image
-from eyesight.video.config import CAPTURE_INTERVAL_SECONDS
+from eyesight.video.scheduler import CaptureScheduler
 
 logger = logging.getLogger(__name__)
 
 
-def get_screen() -> Optional[Dict[str, str]]:
+Monitor = Dict[str, int]
+
+_AREA_KEYS = ("left", "top", "width", "height")
+
+
+def find_window(title: str) -> Optional[Monitor]:
+    """Look up the on-screen geometry of the first window matching `title`.
+
+    Uses `xdotool` on X11 and the Win32 API on Windows.
+
+    Returns:
+        The window's geometry in mss monitor form, or None if not found
+    """
+    if sys.platform == "win32":
+        import ctypes
+        import ctypes.wintypes
+
+        user32 = ctypes.windll.user32
+        hwnd = user32.FindWindowW(None, title)
+        rect = ctypes.wintypes.RECT()
+        if not hwnd or not user32.GetWindowRect(hwnd, ctypes.byref(rect)):
+            return None
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+        return {
+            "left": left,
+            "top": top,
+            "width": right - left,
+            "height": bottom - top,
+        }
+
+    try:
+        output = subprocess.run(
+            [
+                "xdotool",
+                "search",
+                "--onlyvisible",
+                "--limit",
+                "1",
+                "--name",
+                title,
+                "getwindowgeometry",
+                "--shell",
+            ],
+            capture_output=True,
+            text=True,
+            timeout=2,
+        ).stdout
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    geometry = dict(
+        line.split("=", 1) for line in output.splitlines() if "=" in line
+    )
+    if not {"X", "Y", "WIDTH", "HEIGHT"} <= geometry.keys():
+        return None
+    return {
+        "left": int(geometry["X"]),
+        "top": int(geometry["Y"]),
+        "width": int(geometry["WIDTH"]),
+        "height": int(geometry["HEIGHT"]),
+    }
+
+
+def clamp_to_screen(area: Monitor, screen: Monitor) -> Optional[Monitor]:
+    """Clip an area to the virtual screen, or None if nothing is left."""
+    left = max(area["left"], screen["left"])
+    top = max(area["top"], screen["top"])
+    right = min(area["left"] + area["width"], screen["left"] + screen["width"])
+    bottom = min(area["top"] + area["height"], screen["top"] + screen["height"])
+    if right <= left or bottom <= top:
+        return None
+    return {
+        "left": left,
+        "top": top,
+        "width": right - left,
+        "height": bottom - top,
+    }
+
+
+class ScreenGrabber:
+    """Grabs screenshots through a single mss handle kept open for the
+    whole capture session, instead of reopening the display every frame.
+
+    The captured area follows a CaptureTarget: one monitor, all monitors
+    as a single stitched image, a fixed rectangle or a window, whose
+    geometry is looked up again every `WINDOW_REFRESH_SECONDS`. Targets
+    that cannot be resolved fall back to the primary monitor.
+    """
+
+    def __init__(self, target: CaptureTarget = DEFAULT_CAPTURE_TARGET):
+        """
+        Args:
+            target: The part of the screen to capture
+        """
+        self._target = target
+        self._sct: Optional[mss.base.MSSBase] = None
+        self._area: Optional[Monitor] = None
+        self._resolved_at = -math.inf
+
+    def grab(self) -> mss.screenshot.ScreenShot:
+        """Grab the target area, opening the mss handle on first use."""
+        if self._sct is None:
+            self._sct = mss.mss()
+        return self._sct.grab(self._resolve(self._sct.monitors))
+
+    def close(self):
+        """Close the underlying mss handle if it is open."""
+        if self._sct is not None:
+            self._sct.close()
+            self._sct = None
+
+    def _resolve(self, monitors) -> Monitor:
+        target = self._target
+        is_window = target.kind == CaptureTargetKind.WINDOW
+        now = time.monotonic()
+        if self._area is not None and (
+            not is_window or now - self._resolved_at < WINDOW_REFRESH_SECONDS
+        ):
+            return self._area
+
+        area: Optional[Monitor] = None
+        match target.kind:
+            case CaptureTargetKind.MONITOR if (
+                0 <= target.monitor < len(monitors)
+            ):
+                area = monitors[target.monitor]
+            case CaptureTargetKind.ALL:
+                area = monitors[0]
+            case CaptureTargetKind.RECT if target.rect is not None:
+                area = clamp_to_screen(
+                    dict(zip(_AREA_KEYS, target.rect)), monitors[0]
+                )
+            case CaptureTargetKind.WINDOW if target.window:
+                window = find_window(target.window)
+                area = window and clamp_to_screen(window, monitors[0])
+
+        if area is None and self._area is not None:
+            # Keep the last known geometry of a window that went missing
+            area = self._area
+        elif area is None:
+            logger.warning(
+                "Capture target %s not found, using the primary monitor",
+                target,
+            )
+            area = monitors[1]
+        self._area = area
+        self._resolved_at = now
+        return area
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def screenshot_to_image(
+    screenshot: mss.screenshot.ScreenShot, region: Optional[Region] = None
+) -> PIL.Image.Image:
+    """Build a PIL image straight from the raw BGRA screenshot buffer.
+
+    Args:
+        screenshot: The raw screenshot
+        region: Optional crop; only these pixels are converted
+    """
+    if region is None:
+        return PIL.Image.frombuffer(
+            "RGB", screenshot.size, screenshot.raw, "raw", "BGRX", 0, 1
+        )
+
+    left, top, right, bottom = region
+    stride = screenshot.width * 4
+    return PIL.Image.frombuffer(
+        "RGB",
+        (right - left, bottom - top),
+        memoryview(screenshot.raw)[top * stride + left * 4 :],
+        "raw",
+        "BGRX",
+        stride,
+        1,
+    )
+
+
+def get_screen(
+    grabber: ScreenGrabber,
+    detector: Optional[ChangeDetector] = None,
+    decision: GovernorDecision = DEFAULT_DECISION,
+    encoder: Optional[ImageEncoder] = None,
+    timestamp: Optional[float] = None,
+) -> Optional[MediaMessage]:
     """Capture the screen and process it.
 
+    Args:
+        grabber: Screen grabber holding the open mss handle
+        detector: Optional change detector; unchanged screens are skipped
+            before they are encoded and local changes are cropped
+        decision: Capture interval and encode settings to apply
+        encoder: Optional encoder choosing quality (and format) per frame
+        timestamp: Monotonic capture time, defaults to now
+
     Returns:
-        Processed screenshot or None if capture failed
+        Processed screenshot, or None if capture failed or the screen has
+        not changed
     """
     try:
-        with mss.mss() as sct:
-            monitor = sct.monitors[1]
-            screenshot = sct.grab(monitor)
-
-            # Use mss.tools.to_png to convert the screenshot to PNG bytes
-            image_bytes = mss.tools.to_png(screenshot.rgb, screenshot.size)
-            if image_bytes is None:
-                logger.error("Failed to convert screenshot to PNG bytes.")
-                return None
-            img = PIL.Image.open(io.BytesIO(image_bytes))
-
-            return process_image(img)
+        screenshot = grabber.grab()
+        if detector is not None and not detector.check(
+            screenshot.raw, screenshot.size
+        ):
+            return None
+
+        region = detector.region if detector is not None else None
+        img = screenshot_to_image(screenshot, region)
+        return process_image(
+            img,
+            decision.thumbnail_size,
+            decision.quality,
+            encoder,
+            decision.interval,
+            timestamp,
+        )
     except Exception:
         logger.exception("Error capturing or processing screen:")
         return None
 
 
-async def capture_screen(queue: asyncio.Queue) -> None:
-    """Continuously capture screen and add to queue.
+async def capture_screen(
+    queue: asyncio.Queue,
+    detector: Optional[ChangeDetector] = None,
+    scheduler: Optional[CaptureScheduler] = None,
+    governor: Optional[CaptureGovernor] = None,
+    encoder: Optional[ImageEncoder] = None,
+    pool: Optional[EncodePool] = None,
+    target: CaptureTarget = DEFAULT_CAPTURE_TARGET,
+) -> None:
+    """Continuously capture screen and add changed frames to queue.
 
     Args:
         queue: Queue to add captured screenshots to
+        detector: Change detector gating the frames; a default one is
+            created if not provided
+        scheduler: Capture cadence; a default one is created if not provided
+        governor: Optional governor adapting cadence and encode settings
+        encoder: Optional encoder choosing quality (and format) per frame
+        pool: Executor for capture and encode work; a private one is
+            created and shut down with the task if not provided
+        target: The part of the screen to capture
     """
+    own_pool = pool is None
+    pool = pool or EncodePool()
+    detector = detector or ChangeDetector()
+    scheduler = scheduler or CaptureScheduler(name="Screen capture")
+    grabber = ScreenGrabber(target)
     try:
-        while True:
+        async for captured_at in scheduler.ticks():
             try:
-                # Use the safer approach with context manager for each capture
-                frame = await asyncio.to_thread(get_screen)
-                if frame is None:
-                    # If get_screen returns None, it means an error occurred
-                    # and was already logged. We can continue or break.
-                    # For now, let's continue to try capturing in the next loop iteration.
-                    continue
-
-                await asyncio.sleep(CAPTURE_INTERVAL_SECONDS)
-                await queue.put(frame)
+                decision = governor.decision if governor else DEFAULT_DECISION
+                frame = await pool.run(
+                    get_screen,
+                    grabber,
+                    detector,
+                    decision,
+                    encoder,
+                    captured_at,
+                )
+                if governor is not None:
+                    decision = governor.update(
+                        detector.last_change, queue_fill(queue)
+                    )
+                    scheduler.interval = decision.interval
+
+                # None means the screen was unchanged or an error was
+                # already logged; either way there is nothing to send.
+                if frame is not None:
+                    await scheduler.enqueue(queue, frame, captured_at)
             except RuntimeError as e:
                 # Check if this is the "cannot schedule new futures after shutdown" error
                 if "cannot schedule new futures after shutdown" in str(e):
@@ -75,4 +326,20 @@ async def capture_screen(queue: asyncio.Queue) -> None:
     except Exception:
         logger.exception("Error in screen capture:")
     finally:
-        logger.info("Screen capture task exiting")
+        grabber.close()
+        if own_pool:
+            pool.shutdown()
+        scheduler.log_summary()
+        if encoder is not None:
+            encoder.log_summary()
+        stats = detector.stats
+        logger.info(
+            "Screen capture task exiting: %d frames sent (%d keyframes, "
+            "%d crops, %.0f%% mean area), %d skipped (%.0f%% saved)",
+            stats.sent,
+            stats.keyframes,
+            stats.crops,
+            stats.mean_area * 100,
+            stats.skipped,
+            stats.skip_ratio * 100,
+        )